@@ -10,7 +10,6 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from app.views.login import LoginWindow
-from app.views.dashboard import Dashboard
 from app.services.auth_service import AuthService
 from app.utils.db_connector import DatabaseConnector
 
@@ -26,8 +25,12 @@ def main():
         
         def on_login_success(user):
             """Callback function after successful login"""
-            # Open dashboard
-            dashboard = Dashboard(user, auth_service, db_connector)
+            # Imported here so the login window does not wait on dashboard modules
+            from app.views.dashboard import Dashboard
+            
+            # Open dashboard under the login root; logging out shows login again
+            dashboard = Dashboard(user, auth_service, db_connector,
+                                  master=login_window.window, on_logout=login_window.show)
             dashboard.run()
         
         # Show login window
@@ -14,6 +14,15 @@ class UserRole(Enum):
     DOCTOR = "doctor"
     NURSE = "nurse"
     RECEPTIONIST = "receptionist"
+    
+    @property
+    def display_name(self) -> str:
+        """Human-readable role name (e.g., 'Receptionist')"""
+        return _ROLE_DISPLAY_NAMES[self]
+
+
+# Computed once at import; roles are shown on every dashboard and settings open
+_ROLE_DISPLAY_NAMES = {role: role.value.title() for role in UserRole}
 
 
 class UserException(Exception):
@@ -16,6 +16,11 @@ class AuthenticationException(Exception):
 class AuthService:
     """Authentication service for user management"""
     
+    # Passwords outside these bounds can never match a stored one (User
+    # requires at least 6 characters), so they are rejected without a lookup
+    MIN_PASSWORD_LENGTH = 6
+    MAX_PASSWORD_LENGTH = 256
+    
     def __init__(self, db_connector: DatabaseConnector):
         """
         Initialize authentication service
@@ -43,6 +48,9 @@ class AuthService:
         if not username or not password:
             raise AuthenticationException("Username and password are required")
         
+        if not self.MIN_PASSWORD_LENGTH <= len(password) <= self.MAX_PASSWORD_LENGTH:
+            raise AuthenticationException("Invalid username or password")
+        
         # Fetch user from database
         users = self.db.read('users', {'username': username})
         
@@ -20,6 +20,13 @@ class BillingItem:
         self.description = description
         self.quantity = quantity
         self.unit_price = unit_price
+        self._cached_dict = None
+    
+    def __setattr__(self, name, value):
+        """Set a field, dropping the cached dictionary it was part of"""
+        object.__setattr__(self, name, value)
+        if name != '_cached_dict':
+            object.__setattr__(self, '_cached_dict', None)
     
     @property
     def total(self) -> float:
@@ -27,13 +34,20 @@ class BillingItem:
         return self.quantity * self.unit_price
     
     def to_dict(self) -> Dict:
-        """Convert to dictionary"""
-        return {
-            'description': self.description,
-            'quantity': self.quantity,
-            'unit_price': self.unit_price,
-            'total': self.total
-        }
+        """
+        Convert to dictionary
+        
+        The dictionary is cached until a field changes and shared between
+        callers, so it must be treated as read-only.
+        """
+        if self._cached_dict is None:
+            self._cached_dict = {
+                'description': self.description,
+                'quantity': self.quantity,
+                'unit_price': self.unit_price,
+                'total': self.total
+            }
+        return self._cached_dict
 
 
 class Invoice:
@@ -112,6 +126,33 @@ class BillingEngine:
         'medicine': {'name': 'Medicines', 'price': 0.0}  # Variable pricing
     }
     
+    # Combobox display strings for the catalog, formatted once at import
+    SERVICE_DISPLAY_LIST = tuple(
+        f"{code} - {data['name']} (PKR {data['price']})"
+        for code, data in SERVICES.items()
+    )
+    
+    # Display string -> service details, so a combobox selection needs no parsing
+    SERVICE_BY_DISPLAY = dict(zip(SERVICE_DISPLAY_LIST, SERVICES.values()))
+    
+    # Shared engine reused by every billing window
+    _instance = None
+    
+    @classmethod
+    def instance(cls, db_connector: DatabaseConnector) -> 'BillingEngine':
+        """
+        Get the shared billing engine, creating it on first use
+        
+        Args:
+            db_connector: Database connector instance
+            
+        Returns:
+            Billing engine bound to the given connector
+        """
+        if cls._instance is None or cls._instance.db is not db_connector:
+            cls._instance = cls(db_connector)
+        return cls._instance
+    
     def __init__(self, db_connector: DatabaseConnector):
         """
         Initialize billing engine
@@ -221,7 +221,6 @@ class PatientManager:
             Number of active patients
         """
         try:
-            patients = self.db.read('patients', {'is_active': True})
-            return len(patients)
+            return self.db.count('patients', {'is_active': True})
         except Exception as e:
             return 0
@@ -11,6 +11,15 @@ import json
 class ReportGenerator:
     """Generate various types of reports"""
     
+    # Billing columns read for the financial report, unpacked positionally
+    FINANCIAL_COLUMNS = [
+        'CAST(total_amount AS REAL)',
+        "LOWER(COALESCE(payment_status, 'pending'))",
+        "COALESCE(payment_method, 'Unknown')",
+        'bill_date',
+        'services',
+    ]
+    
     def __init__(self, db_connector):
         """
         Initialize report generator
@@ -173,14 +182,12 @@ class ReportGenerator:
             Dictionary containing report data
         """
         try:
-            # Get all billing records
-            bills = self.db.read('billing')
-            
-            # Filter by date if provided
-            if start_date and end_date:
-                bills = [b for b in bills if start_date <= b.get('bill_date', '') <= end_date]
+            # Stream billing records as tuples in FINANCIAL_COLUMNS order
+            bills = self.db.stream_rows('billing', self.FINANCIAL_COLUMNS)
+            filter_dates = bool(start_date and end_date)
             
             # Calculate statistics
+            total_invoices = 0
             total_revenue = 0
             total_pending = 0
             total_paid = 0
@@ -188,26 +195,26 @@ class ReportGenerator:
             daily_revenue = {}
             service_revenue = {}
             
-            for bill in bills:
-                amount = float(bill.get('total_amount', 0))
-                status = bill.get('payment_status', 'pending').lower()
+            for amount, status, payment_method, date, services_json in bills:
+                # Filter by date if provided
+                if filter_dates and not start_date <= date <= end_date:
+                    continue
                 
+                total_invoices += 1
                 total_revenue += amount
                 
                 if status == 'paid':
                     total_paid += amount
-                    payment_method = bill.get('payment_method', 'Unknown')
                     payment_method_distribution[payment_method] = payment_method_distribution.get(payment_method, 0) + amount
                 else:
                     total_pending += amount
                 
                 # Daily revenue
-                date = bill.get('bill_date', 'Unknown')
                 daily_revenue[date] = daily_revenue.get(date, 0) + amount
                 
                 # Service revenue
                 try:
-                    services = json.loads(bill.get('services', '[]'))
+                    services = json.loads(services_json)
                     for service in services:
                         service_name = service.get('description', 'Unknown')
                         service_total = float(service.get('total', 0))
@@ -222,11 +229,10 @@ class ReportGenerator:
                 'total_revenue': total_revenue,
                 'total_paid': total_paid,
                 'total_pending': total_pending,
-                'total_invoices': len(bills),
+                'total_invoices': total_invoices,
                 'payment_method_distribution': payment_method_distribution,
                 'daily_revenue': daily_revenue,
-                'service_revenue': service_revenue,
-                'bills': bills
+                'service_revenue': service_revenue
             }
         except Exception as e:
             return {
@@ -0,0 +1,60 @@
+"""
+Background Tasks - Run blocking work off the Tk main thread
+Executes slow calls (e.g., database reads) in worker threads and delivers
+their results back on the UI thread
+"""
+
+import queue
+import threading
+import tkinter as tk
+from typing import Any, Callable, Optional
+
+
+# How often the UI thread checks for a finished task
+POLL_INTERVAL_MS = 30
+
+
+def run_in_background(widget: tk.Misc, task: Callable[[], Any],
+                      on_success: Callable[[Any], None],
+                      on_error: Optional[Callable[[Exception], None]] = None):
+    """
+    Run a task in a worker thread and deliver its outcome on the Tk thread
+    
+    The worker never touches Tk; the widget polls for the result with
+    after(), so callbacks always run on the main thread. Nothing is
+    delivered if the widget is destroyed before the task finishes.
+    
+    Args:
+        widget: Tk widget used to schedule polling
+        task: Callable executed in the worker thread
+        on_success: Called with the task's return value
+        on_error: Called with the exception raised by the task (optional)
+    """
+    results = queue.Queue(maxsize=1)
+    
+    def worker():
+        try:
+            results.put((True, task()))
+        except Exception as e:
+            results.put((False, e))
+    
+    def poll():
+        try:
+            if not widget.winfo_exists():
+                return
+        except tk.TclError:
+            return
+        
+        try:
+            succeeded, value = results.get_nowait()
+        except queue.Empty:
+            widget.after(POLL_INTERVAL_MS, poll)
+            return
+        
+        if succeeded:
+            on_success(value)
+        elif on_error:
+            on_error(value)
+    
+    threading.Thread(target=worker, daemon=True).start()
+    widget.after(POLL_INTERVAL_MS, poll)
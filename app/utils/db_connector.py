@@ -3,11 +3,11 @@ Database Connector - Database handling using SQLAlchemy
 Handles data persistence using SQLite database
 """
 
-from sqlalchemy import create_engine, Column, Integer, String, Boolean, DateTime, Text, Enum
+from sqlalchemy import create_engine, Column, Integer, String, Boolean, DateTime, Text, Enum, Index, and_, or_, func, literal_column, select, bindparam, cast
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.exc import SQLAlchemyError
-from typing import List, Dict, Any, Optional, Type
+from typing import List, Dict, Any, Iterator, Optional, Tuple, Type
 from pathlib import Path
 from datetime import datetime
 import enum
@@ -53,6 +53,11 @@ class UserModel(Base):
     specialization = Column(String(200))
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime, default=datetime.now)
+    
+    __table_args__ = (
+        # Lets SQLite count active users from the index alone
+        Index('ix_users_active', 'is_active'),
+    )
 
 
 class PatientModel(Base):
@@ -73,6 +78,11 @@ class PatientModel(Base):
     registration_date = Column(String(20), nullable=False)
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime, default=datetime.now)
+    
+    __table_args__ = (
+        # Lets SQLite count active patients from the index alone
+        Index('ix_patients_active', 'is_active'),
+    )
 
 
 class AppointmentModel(Base):
@@ -109,11 +119,24 @@ class BillingModel(Base):
     payment_status = Column(String(50), default='pending')
     payment_method = Column(String(50))
     created_at = Column(DateTime, default=datetime.now)
+    
+    __table_args__ = (
+        # Serves the invoice list's status filter together with its date ordering
+        Index('ix_billing_status_date', 'payment_status', 'bill_date'),
+    )
 
 
 class DatabaseConnector:
     """Handles database operations using SQLAlchemy and SQLite"""
     
+    # Unique ID column for each table
+    ID_FIELDS = {
+        'users': 'user_id',
+        'patients': 'patient_id',
+        'appointments': 'appointment_id',
+        'billing': 'bill_id'
+    }
+    
     def __init__(self, database_url: str = None, data_dir: str = "data"):
         """
         Initialize database connector
@@ -128,6 +151,9 @@ class DatabaseConnector:
             db_path = self.data_dir / "hospital.db"
             database_url = f"sqlite:///{db_path}"
         
+        # Per-table get_by_id() statements, built once and reused
+        self._stmt_cache: Dict[str, Any] = {}
+        
         try:
             self.engine = create_engine(database_url, echo=False)
             self.SessionLocal = sessionmaker(bind=self.engine)
@@ -148,6 +174,11 @@ class DatabaseConnector:
             # Create all tables
             Base.metadata.create_all(self.engine)
             
+            # create_all skips existing tables, so add indexes introduced since
+            for table in Base.metadata.sorted_tables:
+                for index in table.indexes:
+                    index.create(self.engine, checkfirst=True)
+            
             # Add default users if table is empty
             session = self.get_session()
             try:
@@ -230,6 +261,72 @@ class DatabaseConnector:
                 result[column.name] = value
         return result
     
+    def _parse_order_by(self, Model: Type[Base], order_by: str) -> list:
+        """Convert an order_by string into SQLAlchemy ordering clauses"""
+        clauses = []
+        for term in order_by.split(','):
+            parts = term.split()
+            column = getattr(Model, parts[0], None) if parts else None
+            if column is None:
+                raise DatabaseException(f"Unknown order_by column: {term.strip()}")
+            descending = len(parts) > 1 and parts[1].upper() == 'DESC'
+            clauses.append(column.desc() if descending else column.asc())
+        return clauses
+    
+    def _apply_filters(self, query, Model: Type[Base], table: str,
+                       filters: Optional[Dict[str, Any]]):
+        """Add an equality condition to the query for each known filter field"""
+        if filters:
+            for key, value in filters.items():
+                if hasattr(Model, key):
+                    # Handle enum filters
+                    if table == 'users' and key == 'role' and isinstance(value, str):
+                        value = UserRoleEnum(value)
+                    elif table == 'appointments' and key == 'status' and isinstance(value, str):
+                        value = AppointmentStatusEnum(value)
+                    query = query.filter(getattr(Model, key) == value)
+        return query
+    
+    def _refine_query(self, query, Model: Type[Base], table: str,
+                      filters: Optional[Dict[str, Any]], order_by: Optional[str],
+                      limit: Optional[int], offset: int, search: Optional[str],
+                      search_fields: Optional[List[str]]):
+        """Apply the filtering, searching, ordering and pagination shared by reads"""
+        query = self._apply_filters(query, Model, table, filters)
+        
+        if search and search.strip() and search_fields:
+            query = query.filter(self._search_clause(Model, search, search_fields))
+        
+        # Apply ordering and pagination
+        if order_by:
+            query = query.order_by(*self._parse_order_by(Model, order_by))
+        if offset:
+            query = query.offset(offset)
+        if limit is not None:
+            query = query.limit(limit)
+        return query
+    
+    def _search_clause(self, Model: Type[Base], search: str, search_fields: List[str]):
+        """
+        Build a case-insensitive substring match across the given columns
+        
+        Every whitespace-separated word must appear in at least one column,
+        so 'john doe' matches first_name 'John' with last_name 'Doe'.
+        """
+        columns = []
+        for field in search_fields:
+            column = getattr(Model, field, None)
+            if column is None:
+                raise DatabaseException(f"Unknown search column: {field}")
+            columns.append(column)
+        
+        word_clauses = []
+        for word in search.split():
+            # Escape LIKE wildcards so the word is matched literally
+            pattern = '%' + word.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+            word_clauses.append(or_(*(column.ilike(pattern, escape='\\') for column in columns)))
+        return and_(*word_clauses)
+    
     def create(self, table: str, record: Dict[str, Any]) -> bool:
         """
         Create a new record
@@ -267,13 +364,23 @@ class DatabaseConnector:
         finally:
             session.close()
     
-    def read(self, table: str, filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+    def read(self, table: str, filters: Optional[Dict[str, Any]] = None,
+             order_by: Optional[str] = None, limit: Optional[int] = None,
+             offset: int = 0, search: Optional[str] = None,
+             search_fields: Optional[List[str]] = None) -> List[Dict[str, Any]]:
         """
-        Read records with optional filtering
+        Read records with optional filtering, searching, ordering and pagination
         
         Args:
             table: Table name
             filters: Dictionary of field:value pairs to filter by
+            search: Text to match case-insensitively; each of its words must
+                appear somewhere in search_fields
+            search_fields: Columns searched when search is given
+            order_by: Comma-separated columns to sort by, each optionally
+                followed by DESC (e.g., 'bill_date DESC, bill_id DESC')
+            limit: Maximum number of records to return
+            offset: Number of records to skip
             
         Returns:
             List of matching records as dictionaries
@@ -284,18 +391,8 @@ class DatabaseConnector:
         session = self.get_session()
         try:
             Model = self._get_model(table)
-            query = session.query(Model)
-            
-            # Apply filters
-            if filters:
-                for key, value in filters.items():
-                    if hasattr(Model, key):
-                        # Handle enum filters
-                        if table == 'users' and key == 'role' and isinstance(value, str):
-                            value = UserRoleEnum(value)
-                        elif table == 'appointments' and key == 'status' and isinstance(value, str):
-                            value = AppointmentStatusEnum(value)
-                        query = query.filter(getattr(Model, key) == value)
+            query = self._refine_query(session.query(Model), Model, table, filters,
+                                       order_by, limit, offset, search, search_fields)
             
             results = query.all()
             return [self._model_to_dict(result) for result in results]
@@ -304,6 +401,147 @@ class DatabaseConnector:
         finally:
             session.close()
     
+    def read_rows(self, table: str, columns: List[str],
+                  filters: Optional[Dict[str, Any]] = None,
+                  order_by: Optional[str] = None, limit: Optional[int] = None,
+                  offset: int = 0, search: Optional[str] = None,
+                  search_fields: Optional[List[str]] = None) -> List[Tuple]:
+        """
+        Read selected columns or SQL expressions as plain tuples
+        
+        Lets callers that only display a few formatted values have SQLite do
+        the formatting instead of building a dictionary per record.
+        
+        Args:
+            table: Table name
+            columns: Column names or SQL expressions to select, in order
+                (e.g., "UPPER(payment_status)"); must not contain user input
+            filters, order_by, limit, offset, search, search_fields: As for read()
+            
+        Returns:
+            List of tuples, one value per entry in columns
+            
+        Raises:
+            DatabaseException: If read fails
+        """
+        session = self.get_session()
+        try:
+            Model = self._get_model(table)
+            query = session.query(*(literal_column(c) for c in columns)).select_from(Model)
+            query = self._refine_query(query, Model, table, filters,
+                                       order_by, limit, offset, search, search_fields)
+            
+            return [tuple(row) for row in query.all()]
+        except SQLAlchemyError as e:
+            raise DatabaseException(f"Failed to read records: {str(e)}")
+        finally:
+            session.close()
+    
+    def stream_rows(self, table: str, columns: List[str],
+                    filters: Optional[Dict[str, Any]] = None,
+                    order_by: Optional[str] = None,
+                    batch_size: int = 500) -> Iterator[Tuple]:
+        """
+        Iterate over selected columns without materializing the whole result
+        
+        Rows are fetched from the cursor in batches as the caller consumes
+        them, so memory stays flat however large the table is. The session
+        stays open until the iterator is exhausted or closed.
+        
+        Args:
+            table: Table name
+            columns: Column names or SQL expressions to select, as for read_rows()
+            filters: Dictionary of field:value pairs to filter by
+            order_by: Comma-separated columns to sort by, as for read()
+            batch_size: Number of rows fetched from the cursor at a time
+            
+        Yields:
+            One tuple per record, one value per entry in columns
+            
+        Raises:
+            DatabaseException: If read fails
+        """
+        session = self.get_session()
+        try:
+            Model = self._get_model(table)
+            query = session.query(*(literal_column(c) for c in columns)).select_from(Model)
+            query = self._refine_query(query, Model, table, filters,
+                                       order_by, None, 0, None, None)
+            
+            for row in query.yield_per(batch_size):
+                yield tuple(row)
+        except SQLAlchemyError as e:
+            raise DatabaseException(f"Failed to read records: {str(e)}")
+        finally:
+            session.close()
+    
+    def count(self, table: str, filters: Optional[Dict[str, Any]] = None) -> int:
+        """
+        Count records without loading them
+        
+        Args:
+            table: Table name
+            filters: Dictionary of field:value pairs to filter by
+            
+        Returns:
+            Number of matching records
+            
+        Raises:
+            DatabaseException: If count fails
+        """
+        session = self.get_session()
+        try:
+            Model = self._get_model(table)
+            query = self._apply_filters(session.query(func.count(Model.id)), Model, table, filters)
+            return query.scalar()
+        except SQLAlchemyError as e:
+            raise DatabaseException(f"Failed to count records: {str(e)}")
+        finally:
+            session.close()
+    
+    def get_by_id(self, table: str, record_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a single record by its ID
+        
+        The lookup goes through the table's unique ID column, so SQLite
+        answers it from that column's index without scanning the table.
+        
+        Args:
+            table: Table name
+            record_id: Value of the table's ID field (e.g., 'PAT001')
+            
+        Returns:
+            Matching record as a dictionary, or None if not found
+            
+        Raises:
+            DatabaseException: If read fails
+        """
+        session = self.get_session()
+        try:
+            record = session.execute(
+                self._get_by_id_statement(table), {'record_id': record_id}
+            ).scalar_one_or_none()
+            return self._model_to_dict(record) if record else None
+        except SQLAlchemyError as e:
+            raise DatabaseException(f"Failed to read record: {str(e)}")
+        finally:
+            session.close()
+    
+    def _get_by_id_statement(self, table: str):
+        """
+        Get the cached parameterized lookup statement for a table
+        
+        Reusing one statement object lets SQLAlchemy skip recompiling it and
+        the sqlite3 driver reuse its prepared statement on each connection.
+        """
+        stmt = self._stmt_cache.get(table)
+        if stmt is None:
+            Model = self._get_model(table)
+            id_column = getattr(Model, self.ID_FIELDS[table])
+            stmt = select(Model).where(id_column == bindparam('record_id'))
+            self._stmt_cache[table] = stmt
+        return stmt
+    
     def update(self, table: str, record_id: str, id_field: str, updates: Dict[str, Any]) -> bool:
         """
         Update a record
@@ -351,6 +589,44 @@ class DatabaseConnector:
         finally:
             session.close()
     
+    def update_field(self, table: str, record_id: str, id_field: str,
+                     field: str, value: Any) -> bool:
+        """
+        Set one field of a record with a single UPDATE statement
+        
+        Unlike update(), the record is not loaded first, so this suits hot
+        paths that change a plain column such as a status.
+        
+        Args:
+            table: Table name
+            record_id: ID of record to update
+            id_field: Name of ID field
+            field: Column to set
+            value: New value
+            
+        Returns:
+            True if a record was updated
+            
+        Raises:
+            DatabaseException: If the field is not a column or the update fails
+        """
+        session = self.get_session()
+        try:
+            Model = self._get_model(table)
+            if field not in Model.__table__.columns:
+                raise DatabaseException(f"Unknown field for {table}: {field}")
+            
+            updated = session.query(Model).filter(
+                getattr(Model, id_field) == record_id
+            ).update({field: value}, synchronize_session=False)
+            session.commit()
+            return updated > 0
+        except SQLAlchemyError as e:
+            session.rollback()
+            raise DatabaseException(f"Failed to update record: {str(e)}")
+        finally:
+            session.close()
+    
     def delete(self, table: str, record_id: str, id_field: str) -> bool:
         """
         Delete a record
@@ -404,33 +680,23 @@ class DatabaseConnector:
         try:
             Model = self._get_model(table)
             
-            # Map table to ID field name
-            id_field_map = {
-                'users': 'user_id',
-                'patients': 'patient_id',
-                'appointments': 'appointment_id',
-                'billing': 'bill_id'
-            }
-            
-            id_field = id_field_map.get(table)
+            id_field = self.ID_FIELDS.get(table)
             if not id_field:
                 return f"{id_prefix}001"
             
-            # Get all records and find max ID number
-            records = session.query(Model).all()
-            
-            if not records:
-                return f"{id_prefix}001"
-            
-            max_num = 0
-            for record in records:
-                record_id = getattr(record, id_field)
-                if record_id and record_id.startswith(id_prefix):
-                    try:
-                        num = int(record_id.replace(id_prefix, ''))
-                        max_num = max(max_num, num)
-                    except ValueError:
-                        continue
+            # Highest numeric suffix among IDs with this prefix, in one query;
+            # suffixes are compared as numbers so PAT1000 sorts after PAT999.
+            # The prefix is matched exactly (LIKE ignores case and treats '_'
+            # as a wildcard) and IDs with a non-numeric suffix are skipped
+            id_column = getattr(Model, id_field)
+            suffix = func.substr(id_column, len(id_prefix) + 1)
+            max_num = session.execute(
+                select(func.max(cast(suffix, Integer))).where(
+                    func.substr(id_column, 1, len(id_prefix)) == id_prefix,
+                    suffix != '',
+                    suffix.op('NOT GLOB')('*[^0-9]*')
+                )
+            ).scalar() or 0
             
             return f"{id_prefix}{str(max_num + 1).zfill(3)}"
         except SQLAlchemyError as e:
@@ -0,0 +1,12 @@
+"""
+Key Names - Keyboard helpers shared by search entries
+Lists keys whose release never changes an entry's text
+"""
+
+# Modifier and navigation keys; releasing one needs no new search
+NON_EDITING_KEYS = frozenset({
+    'Shift_L', 'Shift_R', 'Control_L', 'Control_R', 'Alt_L', 'Alt_R',
+    'Meta_L', 'Meta_R', 'Super_L', 'Super_R', 'Caps_Lock', 'Num_Lock',
+    'Left', 'Right', 'Up', 'Down', 'Home', 'End', 'Prior', 'Next',
+    'Tab', 'Escape'
+})
@@ -0,0 +1,218 @@
+"""
+UI Styles - Shared ttk theme and named widget styles
+Configures the theme and every named ttk style once per Tk root, so opening
+a window does not re-theme (and re-layout) every ttk widget already shown
+"""
+
+import tkinter as tk
+from tkinter import font as tkfont, ttk
+
+# Root the styles were last applied to; styles live in its Tcl interpreter
+_styled_root = None
+
+# Named fonts of the styled root, referenced by name from widget options;
+# held here because Tk deletes a named font when its Font object is collected
+_named_fonts = []
+
+
+def init_styles(widget: tk.Misc):
+    """
+    Apply the application theme and named styles, once per Tk root
+
+    Args:
+        widget: Any widget belonging to the Tk root to style
+    """
+    global _styled_root
+    root = widget.nametowidget('.')
+    if root is _styled_root:
+        return
+    _styled_root = root
+
+    # Named fonts; widgets pass the name, so Tk looks the font up instead of
+    # parsing a font description for each widget
+    _named_fonts[:] = [
+        tkfont.Font(root=root, name='RegistrationBody', family='Segoe UI', size=10),
+        tkfont.Font(root=root, name='RegistrationSection', family='Segoe UI', size=13, weight='bold'),
+    ]
+
+    style = ttk.Style(root)
+    style.theme_use('clam')
+
+    # Billing invoice list
+    style.configure('Invoice.Treeview',
+                    background='#1a1a2e',
+                    foreground='#ffffff',
+                    fieldbackground='#1a1a2e',
+                    borderwidth=0)
+    style.map('Invoice.Treeview', background=[('selected', '#3498db')])
+    style.configure('Invoice.Treeview.Heading',
+                    background='#16213e',
+                    foreground='#ffffff',
+                    borderwidth=0)
+
+    # Appointments list
+    style.configure('Dark.Treeview',
+                    background='#1a1a2e',
+                    foreground='#ffffff',
+                    fieldbackground='#1a1a2e',
+                    borderwidth=0,
+                    font=('Segoe UI', 9))
+    style.configure('Dark.Treeview.Heading',
+                    background='#16213e',
+                    foreground='#2ecc71',
+                    borderwidth=0,
+                    font=('Segoe UI', 10, 'bold'))
+    style.map('Dark.Treeview', background=[('selected', '#3498db')])
+
+    # Patient records list
+    style.configure('PatientRecords.Treeview',
+                    background='#1a1a2e',
+                    foreground='#ffffff',
+                    fieldbackground='#1a1a2e',
+                    borderwidth=0,
+                    font=('Segoe UI', 9))
+    style.configure('PatientRecords.Treeview.Heading',
+                    background='#16213e',
+                    foreground='#3498db',
+                    borderwidth=0,
+                    font=('Segoe UI', 10, 'bold'))
+    style.map('PatientRecords.Treeview', background=[('selected', '#3498db')])
+
+    # Notebooks
+    style.configure('Billing.TNotebook', background='#16213e', borderwidth=0)
+    style.configure('Billing.TNotebook.Tab',
+                    background='#16213e',
+                    foreground='#ffffff',
+                    padding=[20, 10])
+    style.map('Billing.TNotebook.Tab',
+              background=[('selected', '#3498db')],
+              foreground=[('selected', '#ffffff')])
+
+    style.configure('Settings.TNotebook', background='#16213e', borderwidth=0)
+    style.configure('Settings.TNotebook.Tab',
+                    background='#1a1a2e',
+                    foreground='#ffffff',
+                    padding=[20, 10],
+                    font=('Segoe UI', 10))
+    style.map('Settings.TNotebook.Tab',
+              background=[('selected', '#3498db')],
+              foreground=[('selected', '#ffffff')])
+
+    # Comboboxes
+    style.configure('Dark.TCombobox',
+                    fieldbackground='#1a1a2e',
+                    background='#1a1a2e',
+                    foreground='#ffffff')
+    # Registration form labels and single-line inputs
+    style.configure('Registration.TLabel',
+                    background='#1a1a2e',
+                    foreground='#7f8c8d',
+                    font='RegistrationBody')
+    style.configure('Registration.TEntry',
+                    fieldbackground='#16213e',
+                    foreground='#ffffff',
+                    insertcolor='#3498db',
+                    bordercolor='#16213e',
+                    lightcolor='#16213e',
+                    darkcolor='#16213e',
+                    padding=10)
+
+    style.configure('Registration.TCombobox',
+                    fieldbackground='#16213e',
+                    background='#16213e',
+                    foreground='#ffffff',
+                    arrowcolor='#3498db')
+
+
+# Named emoji fonts of the styled root, by point size, and whether the
+# emoji font family is installed there (None until first checked)
+_emoji_fonts = {}
+_emoji_root = None
+_emoji_available = None
+
+
+def _use_root(widget: tk.Misc) -> tk.Misc:
+    """Reset the emoji font state when a different Tk root is in use"""
+    global _emoji_root, _emoji_available
+    root = widget.nametowidget('.')
+    if root is not _emoji_root:
+        _emoji_fonts.clear()
+        _emoji_available = None
+        _emoji_root = root
+    return root
+
+
+def has_emoji_font(widget: tk.Misc) -> bool:
+    """
+    Check whether the emoji font family is installed, once per Tk root
+
+    Without it Tk falls back through a slow font search to draw emoji.
+
+    Args:
+        widget: Any widget belonging to the Tk root
+
+    Returns:
+        True if 'Segoe UI Emoji' is available
+    """
+    global _emoji_available
+    root = _use_root(widget)
+    if _emoji_available is None:
+        _emoji_available = 'Segoe UI Emoji' in tkfont.families(root)
+    return _emoji_available
+
+
+def emoji_font(widget: tk.Misc, size: int) -> tkfont.Font:
+    """
+    Get the shared emoji font of a given size, created once per Tk root
+
+    Args:
+        widget: Any widget belonging to the Tk root
+        size: Font size in points
+
+    Returns:
+        Named font shared by every emoji icon of that size
+    """
+    root = _use_root(widget)
+
+    font = _emoji_fonts.get(size)
+    if font is None:
+        font = _emoji_fonts[size] = tkfont.Font(root=root, family='Segoe UI Emoji', size=size)
+    return font
+
+
+# Bind tag carrying the shared hover bindings, and the root they live on
+HOVER_TAG = 'HoverButton'
+_hover_root = None
+
+
+def _on_hover_enter(event):
+    """Show a hover button's hover colour"""
+    event.widget.config(bg=event.widget.hover_colors[0])
+
+
+def _on_hover_leave(event):
+    """Restore a hover button's normal colour"""
+    event.widget.config(bg=event.widget.hover_colors[1])
+
+
+def add_hover(button: tk.Widget, hover_bg: str, bg: str):
+    """
+    Change a button's background while the pointer is over it
+
+    Every hover button shares one pair of class bindings, registered once
+    per Tk root, instead of holding two callbacks of its own.
+
+    Args:
+        button: Button (or any widget with a bg option)
+        hover_bg: Background while hovered
+        bg: Background otherwise
+    """
+    global _hover_root
+    root = button.nametowidget('.')
+    if root is not _hover_root:
+        root.bind_class(HOVER_TAG, '<Enter>', _on_hover_enter)
+        root.bind_class(HOVER_TAG, '<Leave>', _on_hover_leave)
+        _hover_root = root
+
+    button.hover_colors = (hover_bg, bg)
+    button.bindtags((HOVER_TAG,) + button.bindtags())
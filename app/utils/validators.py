@@ -4,9 +4,14 @@ Provides validation functions for user inputs
 """
 
 import re
-from datetime import datetime
+from datetime import date, datetime
 from typing import Optional
 
+# Patterns compiled once at import rather than looked up on every call
+EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+PHONE_SEPARATORS = re.compile(r'[\s\-\(\)]')
+ISO_DATE_PATTERN = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+
 
 class ValidationException(Exception):
     """Custom exception for validation errors"""
@@ -29,8 +34,7 @@ def validate_email(email: str) -> bool:
     if not email:
         raise ValidationException("Email is required")
     
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    if not re.match(pattern, email):
+    if not EMAIL_PATTERN.match(email):
         raise ValidationException("Invalid email format")
     
     return True
@@ -53,7 +57,7 @@ def validate_phone(phone: str) -> bool:
         raise ValidationException("Phone number is required")
     
     # Remove common separators
-    cleaned = re.sub(r'[\s\-\(\)]', '', phone)
+    cleaned = PHONE_SEPARATORS.sub('', phone)
     
     if not cleaned.isdigit():
         raise ValidationException("Phone number must contain only digits")
@@ -81,6 +85,16 @@ def validate_date(date_str: str, date_format: str = "%Y-%m-%d") -> bool:
     if not date_str:
         raise ValidationException("Date is required")
     
+    # The default ISO format is checked without strptime's format parsing
+    if date_format == "%Y-%m-%d":
+        if not ISO_DATE_PATTERN.match(date_str):
+            raise ValidationException(f"Date must be in {date_format} format")
+        try:
+            date.fromisoformat(date_str)
+            return True
+        except ValueError:
+            raise ValidationException(f"Date must be in {date_format} format")
+    
     try:
         datetime.strptime(date_str, date_format)
         return True
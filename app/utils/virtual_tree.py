@@ -0,0 +1,149 @@
+"""
+Virtual Treeview - Windowed rendering for long Treeview lists
+Keeps every row in a Python list but only holds the rows that fit in the
+viewport as Treeview items, driving the scrollbar by hand
+"""
+
+from tkinter import ttk
+from typing import Callable, Optional, Sequence
+
+
+class VirtualTreeView:
+    """Render a long list of rows into a Treeview one viewport at a time"""
+
+    def __init__(self, tree: ttk.Treeview, scrollbar: ttk.Scrollbar, row_height: int,
+                 on_scrolled_to_end: Optional[Callable[[], None]] = None):
+        """
+        Take over vertical scrolling of a Treeview
+
+        Args:
+            tree: Treeview to render into; its first column value is used as
+                the item ID, so it must be unique per row
+            scrollbar: Vertical scrollbar, driven by this view
+            row_height: Fixed row height in pixels, applied to the tree's style
+            on_scrolled_to_end: Called when the viewport reaches the last row,
+                e.g. to append another page to the rows list
+        """
+        self.tree = tree
+        self.scrollbar = scrollbar
+        self.row_height = row_height
+        self.on_scrolled_to_end = on_scrolled_to_end
+
+        self.rows: Sequence[tuple] = []
+        self.first_row = 0
+        self.viewport_rows = int(tree.cget('height')) or 15
+
+        # Row ID kept selected across re-renders, set by the owning window
+        self.selected_iid = None
+        
+        # True while the <<TreeviewSelect>> of a re-render restoring that
+        # selection is pending, so the window can tell it from a user's click
+        self.restoring_selection = False
+
+        # IDs of every item created so far, attached or detached
+        self._iids = set()
+
+        # Rows are sized from the viewport height, so their height must be fixed
+        ttk.Style(tree).configure(tree.cget('style') or 'Treeview', rowheight=row_height)
+
+        scrollbar.configure(command=self._on_scroll)
+        tree.bind('<Configure>', self._on_resize)
+        tree.bind('<MouseWheel>', self._on_mousewheel)
+
+    def show(self, rows: Sequence[tuple]):
+        """
+        Replace the rows and render from the top
+
+        Args:
+            rows: Row value tuples; the list is referenced, not copied
+        """
+        self.rows = rows
+        self.first_row = 0
+        self.render()
+
+    def render(self):
+        """Render only the rows that fit in the viewport"""
+        count = self.viewport_rows
+
+        if self.on_scrolled_to_end is not None and self.first_row + count >= len(self.rows):
+            self.on_scrolled_to_end()
+
+        rows = self.rows
+        total = len(rows)
+
+        first = max(0, min(self.first_row, total - count))
+        self.first_row = first
+        window = rows[first:first + count]
+
+        # Create items for rows never shown before
+        for row in window:
+            if row[0] not in self._iids:
+                self.tree.insert('', 'end', iid=row[0], values=row)
+                self._iids.add(row[0])
+
+        # Reorder the whole window in one call; rows that left it are detached
+        # rather than deleted, so they are re-attached if they scroll back in
+        wanted = [row[0] for row in window]
+        self.tree.set_children('', *wanted)
+
+        # Keep the selection when the selected row is still in view
+        if self.selected_iid in wanted:
+            self.restore_selection()
+
+        if total:
+            self.scrollbar.set(first / total, (first + len(window)) / total)
+        else:
+            self.scrollbar.set(0, 1)
+
+    def restore_selection(self):
+        """Re-select the selected row, flagging the resulting select event"""
+        if not self.restoring_selection:
+            self.restoring_selection = True
+            # The select event is queued, and queued events run before idle
+            # callbacks, so the flag stays set until it has been handled
+            self.tree.after_idle(self._end_restoring_selection)
+        self.tree.selection_set(self.selected_iid)
+    
+    def _end_restoring_selection(self):
+        """Clear the flag once the restored selection's event has been handled"""
+        self.restoring_selection = False
+    
+    def update_row(self, iid, values: tuple):
+        """
+        Refresh the values of an item that has already been created
+
+        Args:
+            iid: Row ID (its first column value)
+            values: New row values
+        """
+        if iid in self._iids:
+            self.tree.item(iid, values=values)
+
+    def clear(self):
+        """Delete every item created so far, e.g. when the rows are reloaded"""
+        self.tree.delete(*self._iids)
+        self._iids.clear()
+        self.selected_iid = None
+
+    def _on_resize(self, event):
+        """Recompute how many rows fit in the viewport and re-render"""
+        # One extra row covers a partially visible row at the bottom
+        self.viewport_rows = max(1, event.height // self.row_height + 1)
+        self.render()
+
+    def _on_scroll(self, action, amount, unit=None):
+        """Handle scrollbar commands"""
+        if action == 'moveto':
+            self.first_row = int(float(amount) * len(self.rows))
+        else:
+            step = int(amount)
+            if unit == 'pages':
+                step *= self.viewport_rows
+            self.first_row += step
+        self.render()
+
+    def _on_mousewheel(self, event):
+        """Scroll with the mouse wheel"""
+        self.first_row -= int(event.delta / 120) * 3
+        self.render()
+        return 'break'
@@ -0,0 +1,96 @@
+"""
+Window Helpers - Shared Toplevel/Tk window placement and scrolling
+Sizes and centers windows in one geometry call, without forcing a layout
+pass, and keeps scrollable canvases' wheel bindings and scrollregions cheap
+"""
+
+import tkinter as tk
+
+
+def center_window(window: tk.Wm, width: int, height: int):
+    """
+    Size a window and center it on screen
+
+    The size is known up front, so no update_idletasks() round trip is
+    needed to measure the window before placing it.
+
+    Args:
+        window: Tk or Toplevel window
+        width: Window width in pixels
+        height: Window height in pixels
+    """
+    x = (window.winfo_screenwidth() // 2) - (width // 2)
+    y = (window.winfo_screenheight() // 2) - (height // 2)
+    window.geometry(f'{width}x{height}+{x}+{y}')
+
+
+def bind_mousewheel(canvas: tk.Canvas):
+    """
+    Scroll a canvas with the mouse wheel while the pointer is over it
+
+    The wheel has to be bound application-wide so it also works over the
+    widgets embedded in the canvas, so the binding is only installed while
+    the pointer is inside the canvas and is removed when it leaves or the
+    canvas is destroyed.
+
+    Args:
+        canvas: Scrollable canvas
+    """
+    funcid = None
+
+    def on_wheel(event):
+        canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
+
+    def release(event=None):
+        nonlocal funcid
+        if funcid is None:
+            return
+        # Another canvas may have taken over the wheel since
+        if funcid in canvas.bind_all('<MouseWheel>'):
+            canvas.unbind_all('<MouseWheel>')
+        canvas.deletecommand(funcid)
+        funcid = None
+
+    def on_enter(event):
+        nonlocal funcid
+        release()
+        funcid = canvas.bind_all('<MouseWheel>', on_wheel)
+
+    def on_leave(event):
+        # Moving onto an embedded widget also leaves the canvas itself
+        if 0 <= event.x < canvas.winfo_width() and 0 <= event.y < canvas.winfo_height():
+            return
+        release()
+
+    canvas.bind('<Enter>', on_enter, add='+')
+    canvas.bind('<Leave>', on_leave, add='+')
+    canvas.bind('<Destroy>', release, add='+')
+
+
+def bind_scrollregion(canvas: tk.Canvas, content: tk.Misc):
+    """
+    Keep a canvas scrollregion fitted to its content frame
+
+    Every <Configure> of the content frame in a burst (e.g. while a form is
+    being built) would otherwise measure the whole canvas; instead one
+    update is scheduled for when Tk goes idle.
+
+    Args:
+        canvas: Scrollable canvas
+        content: Frame embedded in the canvas
+    """
+    pending = False
+
+    def update():
+        nonlocal pending
+        pending = False
+        if canvas.winfo_exists():
+            canvas.configure(scrollregion=canvas.bbox('all'))
+
+    def on_configure(event):
+        nonlocal pending
+        if not pending:
+            pending = True
+            canvas.after_idle(update)
+
+    content.bind('<Configure>', on_configure, add='+')
@@ -5,33 +5,34 @@ Handles appointment creation, viewing, and management
 
 import tkinter as tk
 from tkinter import messagebox, ttk
-from datetime import datetime
+from datetime import date
 from app.models.user import User
 from app.models.appointment import Appointment, AppointmentStatus, AppointmentException
 from app.utils.db_connector import DatabaseConnector
 from app.utils.validators import validate_date, validate_time, ValidationException
+from app.utils.styles import add_hover, emoji_font, init_styles
+from app.utils.window import bind_mousewheel, bind_scrollregion, center_window
 
 
 class AppointmentsWindow:
     """Appointments management window"""
     
-    def __init__(self, db_connector: DatabaseConnector, user: User):
+    def __init__(self, db_connector: DatabaseConnector, user: User, master: tk.Misc = None):
         """
         Initialize appointments window
         
         Args:
             db_connector: Database connector instance
             user: Current logged-in user
+            master: Parent window
         """
         self.db = db_connector
         self.user = user
+        self._today_str = date.today().isoformat()
         
-        self.window = tk.Toplevel()
+        self.window = tk.Toplevel(master)
         self.window.title("Appointment Management")
-        self.window.geometry("1200x750")
-        
-        # Center window
-        self._center_window()
+        center_window(self.window, 1200, 750)
         
         # Create UI
         self._create_widgets()
@@ -39,15 +40,6 @@ class AppointmentsWindow:
         # Load appointments
         self.load_appointments()
     
-    def _center_window(self):
-        """Center window on screen"""
-        self.window.update_idletasks()
-        width = self.window.winfo_width()
-        height = self.window.winfo_height()
-        x = (self.window.winfo_screenwidth() // 2) - (width // 2)
-        y = (self.window.winfo_screenheight() // 2) - (height // 2)
-        self.window.geometry(f'{width}x{height}+{x}+{y}')
-    
     def _create_widgets(self):
         """Create UI widgets"""
         # Set window background
@@ -65,7 +57,7 @@ class AppointmentsWindow:
         icon_label = tk.Label(
             header_content,
             text="📅",
-            font=('Segoe UI Emoji', 24),
+            font=emoji_font(self.window, 24),
             bg='#16213e',
             fg='#2ecc71'
         )
@@ -138,14 +130,11 @@ class AppointmentsWindow:
             canvas_width = event.width
             canvas.itemconfig(canvas_frame, width=canvas_width)
         
-        form_frame.bind('<Configure>', lambda e: canvas.configure(scrollregion=canvas.bbox('all')))
+        bind_scrollregion(canvas, form_frame)
         canvas.bind('<Configure>', configure_scroll_region)
         
-        # Enable mousewheel scrolling
-        def on_mousewheel(event):
-            canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-        
-        canvas.bind_all("<MouseWheel>", on_mousewheel)
+        # Scroll with the mouse wheel while the pointer is over the canvas
+        bind_mousewheel(canvas)
         
         # Patient ID
         self._create_form_field(form_frame, "Patient ID:", "patient_id")
@@ -168,12 +157,8 @@ class AppointmentsWindow:
         
         self.doctors_data = doctors  # Store for later use
         
-        # Style combobox
-        style = ttk.Style()
-        style.configure('Dark.TCombobox', 
-                       fieldbackground='#1a1a2e',
-                       background='#1a1a2e',
-                       foreground='#ffffff')
+        # Combobox style (configured once per process)
+        init_styles(self.window)
         
         doctor_combo = ttk.Combobox(
             form_frame,
@@ -213,7 +198,7 @@ class AppointmentsWindow:
         
         # Date
         self._create_form_field(form_frame, "Date (YYYY-MM-DD):", "date")
-        self.date_entry.insert(0, datetime.now().strftime("%Y-%m-%d"))
+        self.date_entry.insert(0, self._today_str)
         
         # Time
         self._create_form_field(form_frame, "Time (HH:MM):", "time")
@@ -259,8 +244,7 @@ class AppointmentsWindow:
             command=self.schedule_appointment
         )
         schedule_btn.pack(fill='x', pady=(0, 5))
-        schedule_btn.bind('<Enter>', lambda e: schedule_btn.config(bg='#27ae60'))
-        schedule_btn.bind('<Leave>', lambda e: schedule_btn.config(bg='#2ecc71'))
+        add_hover(schedule_btn, '#27ae60', '#2ecc71')
         
         clear_btn = tk.Button(
             button_frame,
@@ -274,8 +258,7 @@ class AppointmentsWindow:
             command=self.clear_form
         )
         clear_btn.pack(fill='x')
-        clear_btn.bind('<Enter>', lambda e: clear_btn.config(bg='#7f8c8d'))
-        clear_btn.bind('<Leave>', lambda e: clear_btn.config(bg='#95a5a6'))
+        add_hover(clear_btn, '#7f8c8d', '#95a5a6')
     
     def _create_form_field(self, parent, label_text, field_name):
         """Create a form field"""
@@ -346,29 +329,14 @@ class AppointmentsWindow:
             command=self.load_appointments
         )
         search_btn.pack(side='right')
-        search_btn.bind('<Enter>', lambda e: search_btn.config(bg='#2980b9'))
-        search_btn.bind('<Leave>', lambda e: search_btn.config(bg='#3498db'))
+        add_hover(search_btn, '#2980b9', '#3498db')
         
         # Treeview for appointments
         tree_frame = tk.Frame(parent, bg='#16213e')
         tree_frame.pack(fill='both', expand=True, padx=20, pady=(0, 20))
         
-        # Configure treeview style
-        style = ttk.Style()
-        style.theme_use('clam')
-        style.configure('Dark.Treeview',
-                       background='#1a1a2e',
-                       foreground='#ffffff',
-                       fieldbackground='#1a1a2e',
-                       borderwidth=0,
-                       font=('Segoe UI', 9))
-        style.configure('Dark.Treeview.Heading',
-                       background='#16213e',
-                       foreground='#2ecc71',
-                       borderwidth=0,
-                       font=('Segoe UI', 10, 'bold'))
-        style.map('Dark.Treeview',
-                 background=[('selected', '#3498db')])
+        # Treeview style (configured once per process)
+        init_styles(self.window)
         
         # Scrollbars
         vsb = ttk.Scrollbar(tree_frame, orient='vertical')
@@ -581,7 +549,9 @@ Reason: {appt.get('reason')}
         self.patient_id_entry.delete(0, tk.END)
         self.patient_name_entry.delete(0, tk.END)
         self.date_entry.delete(0, tk.END)
-        self.date_entry.insert(0, datetime.now().strftime("%Y-%m-%d"))
+        # Refresh the cached date in case midnight has passed
+        self._today_str = date.today().isoformat()
+        self.date_entry.insert(0, self._today_str)
         self.time_entry.delete(0, tk.END)
         self.time_entry.insert(0, "09:00")
         self.reason_entry.delete("1.0", tk.END)
@@ -6,48 +6,114 @@ Handles billing, invoice generation, and payment tracking
 import tkinter as tk
 from tkinter import ttk, messagebox
 from datetime import datetime
+import functools
 import json
-from app.services.billing_engine import BillingEngine, Invoice, BillingException
+from app.services.billing_engine import BillingEngine, BillingItem, Invoice, BillingException
 from app.utils.db_connector import DatabaseConnector
+from app.utils.background import run_in_background
+from app.utils.keys import NON_EDITING_KEYS
+from app.utils.styles import init_styles
+from app.utils.virtual_tree import VirtualTreeView
+from app.utils.window import bind_mousewheel, bind_scrollregion, center_window
+
+# Horizontal rules used in the invoice details text
+DETAILS_RULE = '=' * 70
+DETAILS_DIVIDER = '-' * 70
+
+try:
+    import orjson
+except ImportError:  # Optional speedup, fall back to the standard library
+    orjson = None
+
+
+def _dumps(obj, default=None) -> str:
+    """
+    Serialize to a compact JSON string, using orjson when it is installed
+    
+    Args:
+        obj: Object to serialize
+        default: Called for objects the encoder cannot serialize natively
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=default).decode()
+    return json.dumps(obj, default=default, separators=(',', ':'))
+
+
+def _loads(data):
+    """
+    Parse a JSON string, using orjson when it is installed
+    
+    Args:
+        data: JSON text
+        
+    Raises:
+        ValueError: If data is not valid JSON (json.JSONDecodeError subclasses it)
+        TypeError: If data is not a string
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
 class BillingWindow:
     """Billing and invoice management window"""
     
-    def __init__(self, db_connector: DatabaseConnector):
+    # Fixed pixel height of an invoice row, used to size the rendered window
+    INVOICE_ROW_HEIGHT = 22
+    
+    # Delay before a search keystroke triggers filtering (each filter is a query)
+    FILTER_DELAY_MS = 250
+    
+    # Invoice list columns, formatted by SQLite so rows go to the tree as-is
+    INVOICE_LIST_COLUMNS = [
+        'bill_id',
+        'patient_name',
+        "printf('PKR %.2f', total_amount)",
+        "UPPER(COALESCE(payment_status, 'pending'))",
+    ]
+    
+    # Number of invoices fetched from the database per page
+    INVOICE_PAGE_SIZE = 50
+    
+    def __init__(self, db_connector: DatabaseConnector, master: tk.Misc = None):
         """
         Initialize billing window
         
         Args:
             db_connector: Database connector instance
+            master: Parent window
         """
         self.db = db_connector
-        self.billing_engine = BillingEngine(db_connector)
+        self.billing_engine = BillingEngine.instance(db_connector)
         self.current_invoice = None
         
-        self.window = tk.Toplevel()
+        # Invoices matching _search_term and _status_filter, invalidated when
+        # one is saved/updated
+        self._invoice_cache = None
+        self._search_term = ''
+        self._status_filter = None
+        self._invoices_exhausted = False
+        self._invoice_generation = 0
+        
+        # Set while a further page is being fetched, so only one is in flight
+        self._loading_page = False
+        
+        self._filter_job = None
+        
+        # Per-window memo of invoice records by bill_id, cleared when one changes
+        self._fetch_invoice = functools.lru_cache(maxsize=256)(self._read_invoice)
+        
+        self.window = tk.Toplevel(master)
         self.window.title("Billing & Invoice Management")
-        self.window.geometry("1200x700")
+        center_window(self.window, 1200, 700)
         self.window.resizable(False, False)
         
-        # Center window
-        self._center_window()
-        
         # Create UI
         self._create_widgets()
         
         # Load data
         self._load_invoices()
     
-    def _center_window(self):
-        """Center window on screen"""
-        self.window.update_idletasks()
-        width = self.window.winfo_width()
-        height = self.window.winfo_height()
-        x = (self.window.winfo_screenwidth() // 2) - (width // 2)
-        y = (self.window.winfo_screenheight() // 2) - (height // 2)
-        self.window.geometry(f'{width}x{height}+{x}+{y}')
-    
     def _create_widgets(self):
         """Create UI widgets"""
         # Set window background
@@ -142,7 +208,6 @@ class BillingWindow:
         ).pack(side='left', padx=(0, 5))
         
         self.search_var = tk.StringVar()
-        self.search_var.trace('w', lambda *args: self._filter_invoices())
         
         search_entry = tk.Entry(
             search_frame,
@@ -155,14 +220,28 @@ class BillingWindow:
             bd=0
         )
         search_entry.pack(side='left', fill='x', expand=True, ipady=5)
+        search_entry.bind('<KeyRelease>', self._on_search_key)
+        
+        self.status_filter_var = tk.StringVar(value='All')
+        
+        status_combo = ttk.Combobox(
+            search_frame,
+            textvariable=self.status_filter_var,
+            font=('Segoe UI', 10),
+            state='readonly',
+            width=9
+        )
+        status_combo['values'] = ['All', 'Pending', 'Paid']
+        status_combo.pack(side='right', padx=(10, 0))
+        status_combo.bind('<<ComboboxSelected>>', lambda e: self._filter_invoices())
         
         # Treeview for invoices
         tree_frame = tk.Frame(parent, bg='#1a1a2e')
         tree_frame.pack(fill='both', expand=True, padx=15, pady=(0, 15))
         
-        # Scrollbar
-        scrollbar = ttk.Scrollbar(tree_frame)
-        scrollbar.pack(side='right', fill='y')
+        # Scrollbar (driven manually, the tree only holds the visible rows)
+        self.invoice_scrollbar = ttk.Scrollbar(tree_frame)
+        self.invoice_scrollbar.pack(side='right', fill='y')
         
         # Treeview
         self.invoice_tree = ttk.Treeview(
@@ -170,11 +249,9 @@ class BillingWindow:
             columns=('ID', 'Patient', 'Amount', 'Status'),
             show='headings',
             height=15,
-            yscrollcommand=scrollbar.set
+            style='Invoice.Treeview'
         )
         
-        scrollbar.config(command=self.invoice_tree.yview)
-        
         # Configure columns
         self.invoice_tree.heading('ID', text='Invoice ID')
         self.invoice_tree.heading('Patient', text='Patient')
@@ -191,19 +268,12 @@ class BillingWindow:
         # Bind selection event
         self.invoice_tree.bind('<<TreeviewSelect>>', self._on_invoice_select)
         
-        # Configure treeview style
-        style = ttk.Style()
-        style.theme_use('clam')
-        style.configure('Treeview',
-                       background='#1a1a2e',
-                       foreground='#ffffff',
-                       fieldbackground='#1a1a2e',
-                       borderwidth=0)
-        style.map('Treeview', background=[('selected', '#3498db')])
-        style.configure('Treeview.Heading',
-                       background='#16213e',
-                       foreground='#ffffff',
-                       borderwidth=0)
+        # Treeview style; the virtual view sets the row height
+        init_styles(self.window)
+        self.invoice_view = VirtualTreeView(
+            self.invoice_tree, self.invoice_scrollbar, self.INVOICE_ROW_HEIGHT,
+            on_scrolled_to_end=self._on_invoices_scrolled_to_end
+        )
         
         # Action buttons below the list
         action_frame = tk.Frame(parent, bg='#16213e')
@@ -238,7 +308,8 @@ class BillingWindow:
     def _create_invoice_form(self, parent):
         """Create invoice creation/details form"""
         # Notebook for tabs
-        self.notebook = ttk.Notebook(parent)
+        init_styles(self.window)
+        self.notebook = ttk.Notebook(parent, style='Billing.TNotebook')
         self.notebook.pack(fill='both', expand=True, padx=15, pady=15)
         
         # Create Invoice Tab
@@ -246,21 +317,11 @@ class BillingWindow:
         self.notebook.add(create_tab, text='Create Invoice')
         self._create_invoice_creation_form(create_tab)
         
-        # Invoice Details Tab
-        details_tab = tk.Frame(self.notebook, bg='#1a1a2e')
-        self.notebook.add(details_tab, text='Invoice Details')
-        self._create_invoice_details_view(details_tab)
-        
-        # Configure notebook style
-        style = ttk.Style()
-        style.configure('TNotebook', background='#16213e', borderwidth=0)
-        style.configure('TNotebook.Tab',
-                       background='#16213e',
-                       foreground='#ffffff',
-                       padding=[20, 10])
-        style.map('TNotebook.Tab',
-                 background=[('selected', '#3498db')],
-                 foreground=[('selected', '#ffffff')])
+        # Invoice Details Tab (widgets are built on first use)
+        self._details_tab = tk.Frame(self.notebook, bg='#1a1a2e')
+        self.notebook.add(self._details_tab, text='Invoice Details')
+        self._details_built = False
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
     
     def _create_invoice_creation_form(self, parent):
         """Create form for new invoice"""
@@ -269,19 +330,13 @@ class BillingWindow:
         scrollbar = ttk.Scrollbar(parent, orient='vertical', command=canvas.yview)
         scrollable_frame = tk.Frame(canvas, bg='#1a1a2e')
         
-        scrollable_frame.bind(
-            '<Configure>',
-            lambda e: canvas.configure(scrollregion=canvas.bbox('all'))
-        )
+        bind_scrollregion(canvas, scrollable_frame)
         
         canvas.create_window((0, 0), window=scrollable_frame, anchor='nw')
         canvas.configure(yscrollcommand=scrollbar.set)
         
-        # Enable mouse wheel scrolling
-        def _on_mousewheel(event):
-            canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-        
-        canvas.bind_all("<MouseWheel>", _on_mousewheel)
+        # Scroll with the mouse wheel while the pointer is over the canvas
+        bind_mousewheel(canvas)
         
         # Patient Selection Section
         section1 = tk.LabelFrame(
@@ -577,6 +632,17 @@ class BillingWindow:
         canvas.pack(side='left', fill='both', expand=True)
         scrollbar.pack(side='right', fill='y')
     
+    def _on_tab_changed(self, event):
+        """Build the details view the first time its tab is shown"""
+        if self.notebook.index(self.notebook.select()) == 1:
+            self._ensure_details_view()
+    
+    def _ensure_details_view(self):
+        """Create the invoice details widgets if they do not exist yet"""
+        if not self._details_built:
+            self._create_invoice_details_view(self._details_tab)
+            self._details_built = True
+    
     def _create_invoice_details_view(self, parent):
         """Create invoice details view"""
         # Details display
@@ -652,9 +718,7 @@ class BillingWindow:
     
     def _get_service_list(self):
         """Get list of available services"""
-        services = self.billing_engine.SERVICES
-        return [f"{code} - {data['name']} (PKR {data['price']})" 
-                for code, data in services.items()]
+        return BillingEngine.SERVICE_DISPLAY_LIST
     
     def search_patient(self):
         """Search for patient by ID"""
@@ -666,9 +730,8 @@ class BillingWindow:
             return
         
         try:
-            patients = self.db.read('patients', {'patient_id': patient_id})
-            if patients:
-                patient = patients[0]
+            patient = self.db.get_by_id('patients', patient_id)
+            if patient:
                 name = f"{patient['first_name']} {patient['last_name']}"
                 self.patient_name_var.set(name)
                 self.window.lift()
@@ -704,11 +767,9 @@ class BillingWindow:
             return
         
         try:
-            # Parse service code
-            service_code = self.service_var.get().split(' - ')[0]
             quantity = int(self.quantity_var.get())
             
-            service_info = self.billing_engine.get_service_price(service_code)
+            service_info = BillingEngine.SERVICE_BY_DISPLAY.get(self.service_var.get())
             if not service_info:
                 self.window.lift()
                 self.window.focus_force()
@@ -750,21 +811,22 @@ class BillingWindow:
         if not self.current_invoice:
             return
         
-        self.services_text.delete('1.0', tk.END)
-        
-        text = "SERVICES\n"
-        text += "-" * 60 + "\n"
-        text += f"{'Description':<30} {'Qty':>5} {'Price':>10} {'Total':>10}\n"
-        text += "-" * 60 + "\n"
+        separator = "-" * 60 + "\n"
+        parts = [
+            "SERVICES\n",
+            separator,
+            f"{'Description':<30} {'Qty':>5} {'Price':>10} {'Total':>10}\n",
+            separator
+        ]
         
         for item in self.current_invoice.items:
-            text += f"{item.description:<30} {item.quantity:>5} "
-            text += f"PKR{item.unit_price:>7.2f} PKR{item.total:>7.2f}\n"
+            parts.append(f"{item.description:<30} {item.quantity:>5} "
+                         f"PKR{item.unit_price:>7.2f} PKR{item.total:>7.2f}\n")
         
-        text += "-" * 60 + "\n"
-        text += f"{'Subtotal:':<48} PKR{self.current_invoice.subtotal:>8.2f}\n"
+        parts.append(separator)
+        parts.append(f"{'Subtotal:':<48} PKR{self.current_invoice.subtotal:>8.2f}\n")
         
-        self.services_text.insert('1.0', text)
+        self.services_text.replace('1.0', tk.END, ''.join(parts))
     
     def calculate_total(self):
         """Calculate invoice total"""
@@ -775,20 +837,19 @@ class BillingWindow:
             return
         
         try:
-            # Set discount and tax
-            self.current_invoice.discount_percent = float(self.discount_var.get() or 0)
-            self.current_invoice.tax_percent = float(self.tax_var.get() or 0)
+            self._compute_total()
             
             # Update display
             self._update_services_display()
             
             # Show calculation
-            calc_text = f"\nDiscount ({self.current_invoice.discount_percent}%):"
-            calc_text += f"{' ' * 30} -PKR{self.current_invoice.discount_amount:>7.2f}\n"
-            calc_text += f"Tax ({self.current_invoice.tax_percent}%):"
-            calc_text += f"{' ' * 35} PKR{self.current_invoice.tax_amount:>7.2f}\n"
-            calc_text += "=" * 60 + "\n"
-            calc_text += f"{'TOTAL AMOUNT:':<48} PKR{self.current_invoice.total:>8.2f}\n"
+            invoice = self.current_invoice
+            calc_text = (
+                f"\nDiscount ({invoice.discount_percent}%):{' ' * 30} -PKR{invoice.discount_amount:>7.2f}\n"
+                f"Tax ({invoice.tax_percent}%):{' ' * 35} PKR{invoice.tax_amount:>7.2f}\n"
+                f"{'=' * 60}\n"
+                f"{'TOTAL AMOUNT:':<48} PKR{invoice.total:>8.2f}\n"
+            )
             
             self.services_text.insert(tk.END, calc_text)
             
@@ -800,6 +861,16 @@ class BillingWindow:
             self.window.focus_force()
             messagebox.showerror("Error", "Invalid discount or tax value", parent=self.window)
     
+    def _compute_total(self):
+        """
+        Apply the form's discount and tax to the current invoice
+        
+        Raises:
+            ValueError: If discount or tax is not a number
+        """
+        self.current_invoice.discount_percent = float(self.discount_var.get() or 0)
+        self.current_invoice.tax_percent = float(self.tax_var.get() or 0)
+    
     def save_invoice(self):
         """Save invoice to database"""
         if not self.current_invoice or not self.current_invoice.items:
@@ -809,9 +880,15 @@ class BillingWindow:
             return
         
         try:
-            # Calculate final total
-            self.calculate_total()
-            
+            # Calculate final total (the summary text is left as-is)
+            self._compute_total()
+        except ValueError:
+            self.window.lift()
+            self.window.focus_force()
+            messagebox.showerror("Error", "Invalid discount or tax value", parent=self.window)
+            return
+        
+        try:
             # Prepare billing data
             bill_data = {
                 'bill_id': self.current_invoice.invoice_id,
@@ -819,7 +896,7 @@ class BillingWindow:
                 'patient_name': self.current_invoice.patient_name,
                 'appointment_id': None,
                 'bill_date': datetime.now().strftime("%Y-%m-%d"),
-                'services': json.dumps([item.to_dict() for item in self.current_invoice.items]),
+                'services': _dumps(self.current_invoice.items, default=BillingItem.to_dict),
                 'total_amount': str(self.current_invoice.total),
                 'payment_status': 'pending',
                 'payment_method': self.payment_method_var.get()
@@ -837,6 +914,7 @@ class BillingWindow:
                               parent=self.window)
             
             # Reload list and clear form
+            self._invalidate_invoices()
             self._load_invoices()
             self.clear_form()
             
@@ -847,73 +925,162 @@ class BillingWindow:
     
     def clear_form(self):
         """Clear invoice form"""
-        self.patient_id_var.set('')
-        self.patient_name_var.set('')
-        self.service_var.set('')
-        self.quantity_var.set('1')
-        self.discount_var.set('0')
-        self.tax_var.set('0')
-        self.payment_method_var.set('Cash')
-        self.total_amount_var.set('PKR 0.00')
+        form_defaults = (
+            (self.patient_id_var, ''),
+            (self.patient_name_var, ''),
+            (self.service_var, ''),
+            (self.quantity_var, '1'),
+            (self.discount_var, '0'),
+            (self.tax_var, '0'),
+            (self.payment_method_var, 'Cash'),
+            (self.total_amount_var, 'PKR 0.00'),
+        )
+        # Only write variables that changed, so untouched widgets are not redrawn
+        for var, default in form_defaults:
+            if var.get() != default:
+                var.set(default)
         self.services_text.delete('1.0', tk.END)
         self.current_invoice = None
     
     def _load_invoices(self):
-        """Load all invoices"""
-        try:
-            # Clear existing items
-            for item in self.invoice_tree.get_children():
-                self.invoice_tree.delete(item)
-            
-            # Load from database
-            invoices = self.db.read('billing')
-            
-            # Sort by date (newest first)
-            invoices.sort(key=lambda x: x.get('bill_date', ''), reverse=True)
-            
-            # Add to tree
-            for invoice in invoices:
-                status = invoice.get('payment_status', 'pending').upper()
-                amount = float(invoice.get('total_amount', 0))
-                
-                self.invoice_tree.insert('', 'end', values=(
-                    invoice.get('bill_id', ''),
-                    invoice.get('patient_name', ''),
-                    f"₹{amount:.2f}",
-                    status
-                ))
-                
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to load invoices: {str(e)}")
+        """Load the first page of invoices in the background and show it when ready"""
+        if self._invoice_cache is not None:
+            self._show_invoices(self._invoice_cache)
+            return
+        
+        generation = self._invoice_generation
+        search_term = self._search_term
+        status = self._status_filter
+        
+        def on_loaded(invoices):
+            # Drop results superseded by an invalidation or an earlier load
+            if generation != self._invoice_generation or self._invoice_cache is not None:
+                return
+            self._reset_invoice_cache()
+            self._add_invoice_page(invoices, self.INVOICE_PAGE_SIZE)
+            self._show_invoices(self._invoice_cache)
+        
+        run_in_background(
+            self.window,
+            lambda: self._fetch_invoice_page(0, self.INVOICE_PAGE_SIZE, search_term, status),
+            on_loaded,
+            lambda e: messagebox.showerror("Error", f"Failed to load invoices: {str(e)}")
+        )
+    
+    def _on_search_key(self, event):
+        """Schedule filtering for keys that can change the search text"""
+        if event.keysym not in NON_EDITING_KEYS:
+            self._schedule_filter()
+    
+    def _schedule_filter(self):
+        """Debounce search keystrokes so only the last one in a burst filters"""
+        if self._filter_job:
+            self.window.after_cancel(self._filter_job)
+        self._filter_job = self.window.after(self.FILTER_DELAY_MS, self._filter_invoices)
     
     def _filter_invoices(self):
         """Filter invoices based on search"""
-        search_term = self.search_var.get().lower()
+        # A status change filters at once, superseding any pending keystroke
+        if self._filter_job:
+            self.window.after_cancel(self._filter_job)
+        self._filter_job = None
+        search_term = self.search_var.get().strip()
+        status = self.status_filter_var.get().lower()
+        status = None if status == 'all' else status
+        
+        # The database does the matching, so new criteria start a fresh paged list
+        if (search_term, status) != (self._search_term, self._status_filter):
+            self._search_term = search_term
+            self._status_filter = status
+            self._invalidate_invoices()
+        
+        # Queries in the background; results for superseded criteria are dropped
+        self._load_invoices()
+    
+    def _reset_invoice_cache(self):
+        """Start an empty invoice cache"""
+        self._invoice_cache = []
+        self._invoices_exhausted = False
+    
+    def _load_next_page(self):
+        """Fetch the next page of invoices in the background and append it when ready"""
+        if self._loading_page:
+            return
+        self._loading_page = True
         
-        # Clear tree
-        for item in self.invoice_tree.get_children():
-            self.invoice_tree.delete(item)
+        generation = self._invoice_generation
+        offset = len(self._invoice_cache)
+        search_term = self._search_term
+        status = self._status_filter
         
-        # Load and filter
-        try:
-            invoices = self.db.read('billing')
-            
-            for invoice in invoices:
-                # Check if matches search
-                if (search_term in invoice.get('bill_id', '').lower() or
-                    search_term in invoice.get('patient_name', '').lower()):
-                    
-                    status = invoice.get('payment_status', 'pending').upper()
-                    amount = float(invoice.get('total_amount', 0))
-                    
-                    self.invoice_tree.insert('', 'end', values=(
-                        invoice.get('bill_id', ''),
-                        invoice.get('patient_name', ''),
-                        f"PKR {amount:.2f}",
-                        status
-                    ))
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to filter invoices: {str(e)}")
+        def on_loaded(invoices):
+            # A page for superseded criteria must not land in the new list
+            if generation != self._invoice_generation:
+                return
+            self._loading_page = False
+            self._add_invoice_page(invoices, self.INVOICE_PAGE_SIZE)
+            self.invoice_view.render()
+        
+        def on_error(e):
+            if generation == self._invoice_generation:
+                self._loading_page = False
+                self._invoices_exhausted = True
+            messagebox.showerror("Error", f"Failed to load invoices: {str(e)}")
+        
+        run_in_background(
+            self.window,
+            lambda: self._fetch_invoice_page(offset, self.INVOICE_PAGE_SIZE, search_term, status),
+            on_loaded,
+            on_error
+        )
+    
+    def _fetch_invoice_page(self, offset, limit, search_term, status):
+        """Read a page of matching invoices, newest first (safe to call off the Tk thread)"""
+        return self.db.read_rows(
+            'billing',
+            self.INVOICE_LIST_COLUMNS,
+            filters={'payment_status': status} if status else None,
+            order_by='bill_date DESC, bill_id DESC',
+            limit=limit,
+            offset=offset,
+            search=search_term,
+            search_fields=['bill_id', 'patient_name']
+        )
+    
+    def _add_invoice_page(self, rows, limit):
+        """Append a fetched page of invoice list rows to the cache"""
+        if limit is None or len(rows) < limit:
+            self._invoices_exhausted = True
+        
+        self._invoice_cache.extend(rows)
+    
+    def _set_invoice_row_status(self, bill_id, status):
+        """Update the status column of one cached invoice row and its tree item"""
+        if self._invoice_cache is None:
+            return
+        for index, row in enumerate(self._invoice_cache):
+            if row[0] == bill_id:
+                new_row = row[:3] + (status,)
+                self._invoice_cache[index] = new_row
+                self.invoice_view.update_row(bill_id, new_row)
+                return
+    
+    def _invalidate_invoices(self):
+        """Drop cached invoices and every tree item built from them"""
+        self._invoice_cache = None
+        self._invoice_generation += 1
+        self._loading_page = False
+        self.invoice_view.clear()
+    
+    def _show_invoices(self, rows):
+        """Replace the invoice list contents and render from the top"""
+        self.invoice_view.show(rows)
+    
+    def _on_invoices_scrolled_to_end(self):
+        """Fetch another page once the full invoice list is scrolled to its end"""
+        if self.invoice_view.rows is not self._invoice_cache or self._invoices_exhausted:
+            return
+        self._load_next_page()
     
     def _on_invoice_select(self, event):
         """Handle invoice selection"""
@@ -925,17 +1092,39 @@ class BillingWindow:
         item = self.invoice_tree.item(selection[0])
         invoice_id = item['values'][0]
         
+        # A re-render restoring the selection is not a new selection
+        if self.invoice_view.restoring_selection:
+            return
+        self.invoice_view.selected_iid = invoice_id
+        
         # Load invoice details
         try:
-            invoices = self.db.read('billing', {'bill_id': invoice_id})
-            if invoices:
-                self._display_invoice_details(invoices[0])
+            invoice = self._fetch_invoice(invoice_id)
+            if invoice:
+                self._display_invoice_details(invoice)
                 self.notebook.select(1)  # Switch to details tab
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load invoice: {str(e)}")
     
+    def _read_invoice(self, invoice_id):
+        """
+        Read a single invoice record; use the memoized _fetch_invoice instead
+        
+        The services JSON is decoded once here into 'services_parsed', so
+        re-displaying a cached invoice does not parse it again.
+        """
+        invoice = self.db.get_by_id('billing', invoice_id)
+        if invoice is not None:
+            try:
+                invoice['services_parsed'] = _loads(invoice.get('services') or '[]')
+            except (ValueError, TypeError):
+                invoice['services_parsed'] = []
+        return invoice
+    
     def _display_invoice_details(self, invoice_data):
         """Display invoice details"""
+        self._ensure_details_view()
+        
         # Update header
         self.detail_invoice_id.config(text=f"Invoice #: {invoice_data['bill_id']}")
         
@@ -943,29 +1132,27 @@ class BillingWindow:
         status_color = '#2ecc71' if status == 'PAID' else '#e67e22'
         self.detail_status.config(text=f"Status: {status}", fg=status_color)
         
-        # Parse services
-        try:
-            services = json.loads(invoice_data.get('services', '[]'))
-        except (json.JSONDecodeError, TypeError):
-            services = []
+        services = invoice_data['services_parsed']
         
         # Build details text
-        details = "=" * 70 + "\n"
-        details += "                     INVOICE DETAILS\n"
-        details += "=" * 70 + "\n\n"
-        
-        details += f"Invoice ID:        {invoice_data['bill_id']}\n"
-        details += f"Date:              {invoice_data.get('bill_date', 'N/A')}\n"
-        details += f"Patient ID:        {invoice_data.get('patient_id', 'N/A')}\n"
-        details += f"Patient Name:      {invoice_data.get('patient_name', 'N/A')}\n"
-        details += f"Payment Method:    {invoice_data.get('payment_method', 'N/A')}\n"
-        details += f"Status:            {status}\n\n"
-        
-        details += "=" * 70 + "\n"
-        details += "SERVICES\n"
-        details += "=" * 70 + "\n"
-        details += f"{'Description':<35} {'Qty':>5} {'Price':>12} {'Total':>12}\n"
-        details += "-" * 70 + "\n"
+        parts = [
+            DETAILS_RULE,
+            "                     INVOICE DETAILS",
+            DETAILS_RULE,
+            "",
+            f"Invoice ID:        {invoice_data['bill_id']}",
+            f"Date:              {invoice_data.get('bill_date', 'N/A')}",
+            f"Patient ID:        {invoice_data.get('patient_id', 'N/A')}",
+            f"Patient Name:      {invoice_data.get('patient_name', 'N/A')}",
+            f"Payment Method:    {invoice_data.get('payment_method', 'N/A')}",
+            f"Status:            {status}",
+            "",
+            DETAILS_RULE,
+            "SERVICES",
+            DETAILS_RULE,
+            f"{'Description':<35} {'Qty':>5} {'Price':>12} {'Total':>12}",
+            DETAILS_DIVIDER,
+        ]
         
         subtotal = 0
         for service in services:
@@ -975,20 +1162,23 @@ class BillingWindow:
             total = service.get('total', 0)
             subtotal += total
             
-            details += f"{desc:<35} {qty:>5} PKR{price:>9.2f} PKR{total:>9.2f}\n"
-        
-        details += "-" * 70 + "\n"
-        details += f"{'Subtotal:':<56} PKR{subtotal:>10.2f}\n"
+            parts.append(f"{desc:<35} {qty:>5} PKR{price:>9.2f} PKR{total:>9.2f}")
         
         total_amount = float(invoice_data.get('total_amount', 0))
-        details += "=" * 70 + "\n"
-        details += f"{'TOTAL AMOUNT:':<56} PKR{total_amount:>10.2f}\n"
-        details += "=" * 70 + "\n"
+        parts += [
+            DETAILS_DIVIDER,
+            f"{'Subtotal:':<56} PKR{subtotal:>10.2f}",
+            DETAILS_RULE,
+            f"{'TOTAL AMOUNT:':<56} PKR{total_amount:>10.2f}",
+            DETAILS_RULE,
+            "",
+        ]
+        details = '\n'.join(parts)
         
         # Update text widget
+        # One replace() swaps the buffer without passing through an empty state
         self.details_text.config(state='normal')
-        self.details_text.delete('1.0', tk.END)
-        self.details_text.insert('1.0', details)
+        self.details_text.replace('1.0', tk.END, details)
         self.details_text.config(state='disabled')
         
         # Store current invoice ID
@@ -1008,16 +1198,24 @@ class BillingWindow:
         
         if messagebox.askyesno("Confirm", "Mark this invoice as paid?", parent=self.window):
             try:
-                self.db.update('billing', invoice_id, 'bill_id', 
-                             {'payment_status': 'paid'})
+                # Already memoized from the selection, so normally no extra read
+                invoice = self._fetch_invoice(invoice_id)
+                
+                self.db.update_field('billing', invoice_id, 'bill_id', 'payment_status', 'paid')
+                self._fetch_invoice.cache_clear()
                 messagebox.showinfo("Success", "Invoice marked as paid", parent=self.window)
-                self._load_invoices()
+                
+                # Only the status changed, so patch the list row in place unless
+                # a status filter means the invoice should drop out of the list
+                if self._status_filter is None:
+                    self._set_invoice_row_status(invoice_id, 'PAID')
+                else:
+                    self._invalidate_invoices()
+                    self._load_invoices()
                 
                 # Update details if it's currently displayed
-                if hasattr(self, 'selected_invoice_id') and self.selected_invoice_id == invoice_id:
-                    invoices = self.db.read('billing', {'bill_id': invoice_id})
-                    if invoices:
-                        self._display_invoice_details(invoices[0])
+                if invoice and getattr(self, 'selected_invoice_id', None) == invoice_id:
+                    self._display_invoice_details({**invoice, 'payment_status': 'paid'})
                     
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to update invoice: {str(e)}", parent=self.window)
@@ -1034,9 +1232,9 @@ class BillingWindow:
         invoice_id = item['values'][0]
         
         # Fetch and display invoice details
-        invoices = self.db.read('billing', {'bill_id': invoice_id})
-        if invoices:
-            self._display_invoice_details(invoices[0])
+        invoice = self._fetch_invoice(invoice_id)
+        if invoice:
+            self._display_invoice_details(invoice)
     
     def print_invoice(self):
         """Print invoice"""
@@ -3,18 +3,33 @@ Dashboard Window - Main navigation hub
 Main application interface with navigation to all features
 """
 
+import logging
 import tkinter as tk
 from tkinter import messagebox
-from app.models.user import User
-from app.services.auth_service import AuthService
-from app.services.patient_manager import PatientManager
-from app.utils.db_connector import DatabaseConnector
+import time
+from typing import TYPE_CHECKING, Callable, Optional
+from app.utils.styles import add_hover, emoji_font
+from app.utils.window import center_window
+
+if TYPE_CHECKING:  # Typing only, keeps importing this module cheap before login
+    from app.models.user import User
+    from app.services.auth_service import AuthService
+    from app.utils.db_connector import DatabaseConnector
+
+logger = logging.getLogger(__name__)
 
 
 class Dashboard:
     """Main dashboard window"""
     
-    def __init__(self, user: User, auth_service: AuthService, db_connector: DatabaseConnector):
+    # Seconds a statistic stays cached between dashboard openings
+    STATS_TTL = 30
+    
+    # Statistic name -> (value, expiry time), shared by every dashboard
+    _stats_cache = {}
+    
+    def __init__(self, user: 'User', auth_service: 'AuthService', db_connector: 'DatabaseConnector',
+                 master: Optional[tk.Misc] = None, on_logout: Optional[Callable[[], None]] = None):
         """
         Initialize dashboard
         
@@ -22,35 +37,33 @@ class Dashboard:
             user: Current logged-in user
             auth_service: Authentication service
             db_connector: Database connector
+            master: Existing Tk root to open under; a new root is created if omitted
+            on_logout: Called after logout instead of restarting the application
         """
+        from app.services.patient_manager import PatientManager
+        
         self.user = user
         self.auth_service = auth_service
         self.db = db_connector
         self.patient_manager = PatientManager(db_connector)
+        self.master = master
+        self.on_logout = on_logout
+        self._user_label = f"{user.full_name}\n{user.role.display_name}"
         
-        self.window = tk.Tk()
+        # Reuse the login root when given one; creating a Tk root is slow
+        self.window = tk.Toplevel(master) if master is not None else tk.Tk()
+        # Feature windows are opened as its children, so destroying it on
+        # logout or exit closes them too
         self.window.title("Hospital Management System - Dashboard")
-        self.window.geometry("900x600")
+        center_window(self.window, 900, 600)
         self.window.resizable(False, False)
         
-        # Center window
-        self._center_window()
-        
         # Create UI
         self._create_widgets()
         
         # Handle window close
         self.window.protocol("WM_DELETE_WINDOW", self.on_closing)
     
-    def _center_window(self):
-        """Center window on screen"""
-        self.window.update_idletasks()
-        width = self.window.winfo_width()
-        height = self.window.winfo_height()
-        x = (self.window.winfo_screenwidth() // 2) - (width // 2)
-        y = (self.window.winfo_screenheight() // 2) - (height // 2)
-        self.window.geometry(f'{width}x{height}+{x}+{y}')
-    
     def _create_widgets(self):
         """Create UI widgets"""
         # Set window background
@@ -69,7 +82,7 @@ class Dashboard:
         icon_label = tk.Label(
             title_container,
             text="🏥",
-            font=('Segoe UI Emoji', 28),
+            font=emoji_font(self.window, 28),
             bg='#16213e',
             fg='#3498db'
         )
@@ -92,7 +105,7 @@ class Dashboard:
         user_icon = tk.Label(
             user_container,
             text="👤",
-            font=('Segoe UI Emoji', 16),
+            font=emoji_font(self.window, 16),
             bg='#16213e',
             fg='#3498db'
         )
@@ -100,7 +113,7 @@ class Dashboard:
         
         user_label = tk.Label(
             user_container,
-            text=f"{self.user.full_name}\n{self.user.role.value.title()}",
+            text=self._user_label,
             font=('Segoe UI', 10),
             bg='#16213e',
             fg='#ffffff',
@@ -145,19 +158,19 @@ class Dashboard:
             command=self.logout
         )
         logout_btn.pack(side='right', padx=25, pady=10)
-        logout_btn.bind('<Enter>', lambda e: logout_btn.config(bg='#c0392b'))
-        logout_btn.bind('<Leave>', lambda e: logout_btn.config(bg='#e74c3c'))
+        add_hover(logout_btn, '#c0392b', '#e74c3c')
     
     def _create_stats_cards(self, parent):
         """Create statistics cards"""
         # Get statistics
-        total_patients = self.patient_manager.get_patient_count()
-        total_appointments = len(self.db.read('appointments'))
+        total_patients = self._get_stat('patients', self.patient_manager.get_patient_count)
+        total_appointments = self._get_stat('appointments', lambda: self.db.count('appointments'))
+        active_users = self._get_stat('active_users', lambda: self.db.count('users', {'is_active': True}))
         
         stats = [
             ("👥 Total Patients", total_patients, "#3498db", "#2980b9"),
             ("📅 Appointments", total_appointments, "#2ecc71", "#27ae60"),
-            ("👨‍⚕️ Active Users", len(self.db.read('users', {'is_active': True})), "#e67e22", "#d35400")
+            ("👨‍⚕️ Active Users", active_users, "#e67e22", "#d35400")
         ]
         
         for i, (label, value, color, hover_color) in enumerate(stats):
@@ -195,6 +208,26 @@ class Dashboard:
             )
             title_label.pack(pady=(0, 20))
     
+    def _get_stat(self, name, loader):
+        """
+        Get a statistic, reusing the cached value until it expires
+        
+        Args:
+            name: Cache key for the statistic
+            loader: Callable that computes the statistic
+            
+        Returns:
+            The statistic value
+        """
+        now = time.monotonic()
+        cached = self._stats_cache.get(name)
+        if cached is not None and cached[1] > now:
+            return cached[0]
+        
+        value = loader()
+        self._stats_cache[name] = (value, now + self.STATS_TTL)
+        return value
+    
     def _create_navigation_buttons(self, parent):
         """Create navigation buttons"""
         buttons = [
@@ -234,8 +267,7 @@ class Dashboard:
             btn.place(relx=0, rely=0, relwidth=1, relheight=0.98)
             
             # Hover effects
-            btn.bind('<Enter>', lambda e, b=btn, hc=hover_color: b.config(bg=hc))
-            btn.bind('<Leave>', lambda e, b=btn, c=color: b.config(bg=c))
+            add_hover(btn, hover_color, color)
             
             col += 1
             if col > 1:
@@ -251,45 +283,39 @@ class Dashboard:
     def open_patient_registration(self):
         """Open patient registration window"""
         from app.views.patient_reg import PatientRegistrationWindow
-        PatientRegistrationWindow(self.db, self.patient_manager)
+        PatientRegistrationWindow.open(self.db, self.patient_manager, self.window)
     
     def open_appointments(self):
         """Open appointments window"""
         from app.views.appointments import AppointmentsWindow
-        AppointmentsWindow(self.db, self.user)
+        AppointmentsWindow(self.db, self.user, self.window)
     
     def open_billing(self):
         """Open billing window"""
         from app.views.billing import BillingWindow
-        BillingWindow(self.db)
+        BillingWindow(self.db, self.window)
     
     def open_reports(self):
         """Open reports window"""
         try:
-            print("DEBUG: Opening reports window...")
             from app.views.reports import ReportsWindow
-            ReportsWindow(self.db)
+            ReportsWindow(self.db, self.window)
         except Exception as e:
-            print(f"ERROR: Failed to open reports: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            logger.error("Failed to open reports", exc_info=e)
             messagebox.showerror("Error", f"Failed to open reports: {str(e)}")
     
     def open_patient_records(self):
         """Open patient records window"""
         from app.views.patient_records import PatientRecordsWindow
-        PatientRecordsWindow(self.db)
+        PatientRecordsWindow(self.db, self.window)
     
     def open_settings(self):
         """Open settings window"""
         try:
-            print("DEBUG: Opening settings window...")
             from app.views.settings import SettingsWindow
-            SettingsWindow(self.user, self.db, self.auth_service)
+            SettingsWindow(self.user, self.db, self.auth_service, self.window)
         except Exception as e:
-            print(f"ERROR: Failed to open settings: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            logger.error("Failed to open settings", exc_info=e)
             messagebox.showerror("Error", f"Failed to open settings: {str(e)}")
     
     def logout(self):
@@ -298,6 +324,10 @@ class Dashboard:
             self.auth_service.logout()
             self.window.destroy()
             
+            if self.on_logout is not None:
+                self.on_logout()
+                return
+            
             # Restart application
             from app.main import main
             main()
@@ -306,7 +336,11 @@ class Dashboard:
         """Handle window close"""
         if messagebox.askyesno("Exit", "Are you sure you want to exit?"):
             self.window.destroy()
+            if self.master is not None:
+                self.master.destroy()
     
     def run(self):
         """Start the dashboard"""
-        self.window.mainloop()
+        # Under an existing root, that root's event loop is already running
+        if self.master is None:
+            self.window.mainloop()
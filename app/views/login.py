@@ -4,50 +4,46 @@ Handles user authentication interface
 """
 
 import tkinter as tk
-from tkinter import messagebox, ttk
 from app.services.auth_service import AuthService, AuthenticationException
+from app.utils.styles import add_hover, emoji_font, init_styles
+from app.utils.window import center_window
 
 
 class LoginWindow:
     """Login window for staff authentication"""
     
+    # Seconds the login button stays disabled after a failed attempt
+    RETRY_DELAY = 1.0
+    
     def __init__(self, auth_service: AuthService, on_success_callback):
         """
         Initialize login window
         
         Args:
             auth_service: Authentication service instance
-            on_success_callback: Function to call on successful login
+            on_success_callback: Function to call on successful login; the
+                login window is hidden, not destroyed, so its root can be reused
         """
         self.auth_service = auth_service
         self.on_success_callback = on_success_callback
         
         self.window = tk.Tk()
         self.window.title("Hospital Management System - Login")
-        self.window.geometry("600x700")
+        center_window(self.window, 600, 700)
         self.window.resizable(False, False)
         
-        # Center window
-        self._center_window()
-        
         # Configure style
         self._setup_styles()
         
         # Create UI
         self._create_widgets()
     
-    def _center_window(self):
-        """Center window on screen"""
-        self.window.update_idletasks()
-        width = self.window.winfo_width()
-        height = self.window.winfo_height()
-        x = (self.window.winfo_screenwidth() // 2) - (width // 2)
-        y = (self.window.winfo_screenheight() // 2) - (height // 2)
-        self.window.geometry(f'{width}x{height}+{x}+{y}')
-    
     def _setup_styles(self):
         """Setup UI styles"""
         self.window.configure(bg='#1a1a2e')
+        
+        # Shared ttk styles, set up once for every window opened after login
+        init_styles(self.window)
     
     def _create_widgets(self):
         """Create UI widgets"""
@@ -64,7 +60,7 @@ class LoginWindow:
         icon_label = tk.Label(
             header_frame,
             text="🏥",
-            font=('Segoe UI Emoji', 60),
+            font=emoji_font(self.window, 60),
             bg='#16213e',
             fg='#0f4c75'
         )
@@ -89,19 +85,17 @@ class LoginWindow:
         )
         subtitle_label.pack(pady=(0, 20))
         
-        # Login form container with shadow effect
-        form_container = tk.Frame(main_frame, bg='#1a1a2e')
-        form_container.pack(pady=40, padx=50, fill='both', expand=True)
-        
-        # Shadow effect frame
-        shadow_frame = tk.Frame(form_container, bg='#0d0d1a', relief='flat')
-        shadow_frame.place(relx=0.5, rely=0.5, anchor='center', 
-                          relwidth=0.95, relheight=0.85)
-        
-        # Main form frame (appears to float above shadow)
-        form_frame = tk.Frame(form_container, bg='#16213e', relief='flat', bd=0)
-        form_frame.place(relx=0.5, rely=0.5, anchor='center', 
-                        relwidth=0.92, relheight=0.82)
+        # Login form; a dark highlight border stands in for a drop shadow
+        form_frame = tk.Frame(
+            main_frame,
+            bg='#16213e',
+            relief='flat',
+            bd=0,
+            highlightthickness=2,
+            highlightbackground='#0d0d1a',
+            highlightcolor='#0d0d1a'
+        )
+        form_frame.pack(pady=60, padx=70, fill='both', expand=True)
         
         # Login header
         form_title = tk.Label(
@@ -132,7 +126,7 @@ class LoginWindow:
         user_icon = tk.Label(
             username_frame,
             text="👤",
-            font=('Segoe UI Emoji', 14),
+            font=emoji_font(self.window, 14),
             bg='#1a1a2e',
             fg='#3498db'
         )
@@ -169,7 +163,7 @@ class LoginWindow:
         pass_icon = tk.Label(
             password_frame,
             text="🔒",
-            font=('Segoe UI Emoji', 14),
+            font=emoji_font(self.window, 14),
             bg='#1a1a2e',
             fg='#3498db'
         )
@@ -188,11 +182,11 @@ class LoginWindow:
         self.password_entry.pack(side='left', fill='x', expand=True, pady=12, padx=(0, 15))
         
         # Bind Enter key
-        self.password_entry.bind('<Return>', lambda e: self.login())
+        self.password_entry.bind('<Return>', self._on_password_return)
         self.username_entry.bind('<Return>', lambda e: self.password_entry.focus())
         
         # Login button with hover effect
-        login_btn = tk.Button(
+        self.login_btn = tk.Button(
             form_frame,
             text="LOGIN",
             font=('Segoe UI', 12, 'bold'),
@@ -207,11 +201,10 @@ class LoginWindow:
             bd=0,
             command=self.login
         )
-        login_btn.pack(pady=(20, 20), padx=40, fill='x')
+        self.login_btn.pack(pady=(20, 20), padx=40, fill='x')
         
         # Add hover effect
-        login_btn.bind('<Enter>', lambda e: login_btn.config(bg='#2980b9'))
-        login_btn.bind('<Leave>', lambda e: login_btn.config(bg='#3498db'))
+        add_hover(self.login_btn, '#2980b9', '#3498db')
         
         # Divider
         divider = tk.Frame(form_frame, bg='#2c3e50', height=1)
@@ -260,6 +253,9 @@ class LoginWindow:
     
     def login(self):
         """Handle login button click"""
+        # Dialogs are only needed once the user submits, not to draw the window
+        from tkinter import messagebox
+        
         username = self.username_entry.get().strip()
         password = self.password_entry.get()
         
@@ -273,16 +269,38 @@ class LoginWindow:
             
             # Success
             messagebox.showinfo("Success", f"Welcome, {user.full_name}!")
-            self.window.destroy()
+            self.window.withdraw()
             self.on_success_callback(user)
             
         except AuthenticationException as e:
             messagebox.showerror("Login Failed", str(e))
             self.password_entry.delete(0, tk.END)
             self.password_entry.focus()
+            # Timed from dismissal, so the Enter that closes the dialog is ignored
+            self._block_retry()
         except Exception as e:
             messagebox.showerror("Error", f"An error occurred: {str(e)}")
     
+    def _on_password_return(self, event):
+        """Submit on Enter, unless a retry is still blocked"""
+        if self.login_btn.cget('state') != 'disabled':
+            self.login()
+    
+    def _block_retry(self):
+        """Throttle rapid retries (e.g., holding Enter) after a failed attempt"""
+        self.login_btn.config(state='disabled', text="PLEASE WAIT...")
+        self.window.after(int(self.RETRY_DELAY * 1000), self._allow_retry)
+    
+    def _allow_retry(self):
+        """Re-enable logging in once the retry delay has passed"""
+        self.login_btn.config(state='normal', text="LOGIN")
+    
+    def show(self):
+        """Show the login window again, e.g. after logout"""
+        self.password_entry.delete(0, tk.END)
+        self.window.deiconify()
+        self.username_entry.focus()
+    
     def run(self):
         """Start the login window"""
         self.window.mainloop()
@@ -3,44 +3,63 @@ Patient Records Window - View and search patient records
 Displays all registered patients with search functionality
 """
 
+import logging
+from operator import itemgetter
 import tkinter as tk
 from tkinter import messagebox, ttk
 from app.utils.db_connector import DatabaseConnector
+from app.utils.background import run_in_background
+from app.utils.styles import add_hover, emoji_font, init_styles
+from app.utils.virtual_tree import VirtualTreeView
+from app.utils.window import center_window
+
+logger = logging.getLogger(__name__)
 
 
 class PatientRecordsWindow:
     """Patient records viewer window"""
     
-    def __init__(self, db_connector: DatabaseConnector):
+    # Delay before a search keystroke triggers filtering
+    SEARCH_DELAY_MS = 150
+    
+    # Columns the database searches when a search term is entered
+    SEARCH_FIELDS = ['patient_id', 'first_name', 'last_name', 'phone', 'email']
+    
+    # Fixed row height, so the virtual list can size its viewport
+    PATIENT_ROW_HEIGHT = 22
+    
+    # Record fields shown after the name column, read in one call per row;
+    # records from the database always carry every column
+    _detail_fields = itemgetter('date_of_birth', 'gender', 'phone', 'email', 'blood_group', 'address')
+    
+    def __init__(self, db_connector: DatabaseConnector, master: tk.Misc = None):
         """
         Initialize patient records window
         
         Args:
             db_connector: Database connector instance
+            master: Parent window
         """
         self.db = db_connector
         
-        self.window = tk.Toplevel()
-        self.window.title("Patient Records")
-        self.window.geometry("1200x700")
+        # Active patients read from the database, shown when not searching
+        self._patients_cache = None
+        self._patients_by_id = {}
+        self._patient_rows = []
+        self._search_job = None
+        self._last_search_term = ''
+        self._last_stats = None
+        self._load_generation = 0
         
-        # Center window
-        self._center_window()
+        self.window = tk.Toplevel(master)
+        self.window.title("Patient Records")
+        center_window(self.window, 1200, 700)
         
         # Create UI
         self._create_widgets()
         
-        # Load patients
-        self.load_patients()
-    
-    def _center_window(self):
-        """Center window on screen"""
-        self.window.update_idletasks()
-        width = self.window.winfo_width()
-        height = self.window.winfo_height()
-        x = (self.window.winfo_screenwidth() // 2) - (width // 2)
-        y = (self.window.winfo_screenheight() // 2) - (height // 2)
-        self.window.geometry(f'{width}x{height}+{x}+{y}')
+        # Load patients once the window has been drawn
+        self.window.after_idle(self.load_patients)
     
     def _create_widgets(self):
         """Create UI widgets"""
@@ -59,7 +78,7 @@ class PatientRecordsWindow:
         icon_label = tk.Label(
             header_content,
             text="👥",
-            font=('Segoe UI Emoji', 24),
+            font=emoji_font(self.window, 24),
             bg='#16213e',
             fg='#3498db'
         )
@@ -100,7 +119,11 @@ class PatientRecordsWindow:
             insertbackground='#3498db'
         )
         self.search_entry.pack(side='left', fill='x', expand=True, padx=(0, 15), ipady=8)
-        self.search_entry.bind('<KeyRelease>', lambda e: self.load_patients())
+        
+        # Key validation runs only for edits that change the text, so
+        # modifier and navigation keys never reach Python
+        search_vcmd = (self.window.register(self._on_search_text), '%P')
+        self.search_entry.config(validate='key', validatecommand=search_vcmd)
         
         # Refresh button
         refresh_btn = tk.Button(
@@ -112,16 +135,15 @@ class PatientRecordsWindow:
             cursor='hand2',
             relief='flat',
             bd=0,
-            command=self.load_patients
+            command=self.refresh_patients
         )
         refresh_btn.pack(side='right', padx=5)
-        refresh_btn.bind('<Enter>', lambda e: refresh_btn.config(bg='#2980b9'))
-        refresh_btn.bind('<Leave>', lambda e: refresh_btn.config(bg='#3498db'))
+        add_hover(refresh_btn, '#2980b9', '#3498db')
         
         # Stats label
         self.stats_label = tk.Label(
             main_container,
-            text="Total Patients: 0",
+            text="Loading patients...",
             font=('Segoe UI', 10),
             bg='#16213e',
             fg='#7f8c8d'
@@ -132,24 +154,10 @@ class PatientRecordsWindow:
         tree_frame = tk.Frame(main_container, bg='#16213e')
         tree_frame.pack(fill='both', expand=True, padx=20, pady=(0, 20))
         
-        # Configure treeview style
-        style = ttk.Style()
-        style.theme_use('clam')
-        style.configure('PatientRecords.Treeview',
-                       background='#1a1a2e',
-                       foreground='#ffffff',
-                       fieldbackground='#1a1a2e',
-                       borderwidth=0,
-                       font=('Segoe UI', 9))
-        style.configure('PatientRecords.Treeview.Heading',
-                       background='#16213e',
-                       foreground='#3498db',
-                       borderwidth=0,
-                       font=('Segoe UI', 10, 'bold'))
-        style.map('PatientRecords.Treeview',
-                 background=[('selected', '#3498db')])
-        
-        # Scrollbars
+        # Treeview style (configured once per process)
+        init_styles(self.window)
+        
+        # Scrollbars (the vertical one is driven by the virtual list)
         vsb = ttk.Scrollbar(tree_frame, orient='vertical')
         hsb = ttk.Scrollbar(tree_frame, orient='horizontal')
         
@@ -158,12 +166,10 @@ class PatientRecordsWindow:
             tree_frame,
             columns=('ID', 'Name', 'DOB', 'Gender', 'Phone', 'Email', 'Blood Group', 'Address'),
             show='headings',
-            yscrollcommand=vsb.set,
             xscrollcommand=hsb.set,
             style='PatientRecords.Treeview'
         )
         
-        vsb.config(command=self.patients_tree.yview)
         hsb.config(command=self.patients_tree.xview)
         
         # Define columns
@@ -192,77 +198,154 @@ class PatientRecordsWindow:
         tree_frame.grid_rowconfigure(0, weight=1)
         tree_frame.grid_columnconfigure(0, weight=1)
         
-        # Context menu
+        # Only the rows in view are held as tree items
+        self.patient_view = VirtualTreeView(self.patients_tree, vsb, self.PATIENT_ROW_HEIGHT)
+        self.patients_tree.bind('<<TreeviewSelect>>', self._on_patient_select)
+        
+        # Context menu, built once and reposted on each right-click
+        self.context_menu = tk.Menu(self.window, tearoff=0, bg='#16213e', fg='#ffffff', font=('Segoe UI', 9))
+        self.context_menu.add_command(label="View Details", command=self.view_patient_details)
+        self.context_menu.add_command(label="Delete Patient", command=self.delete_patient)
+        
         self.patients_tree.bind('<Double-Button-1>', self.view_patient_details)
         self.patients_tree.bind('<Button-3>', self.show_context_menu)
     
-    def load_patients(self):
-        """Load patients into treeview"""
-        try:
-            # Clear existing items
-            for item in self.patients_tree.get_children():
-                self.patients_tree.delete(item)
-            
-            # Get search term
-            search_term = self.search_entry.get().strip().lower()
-            
-            # Load patients - filter for active patients only
-            patients = self.db.read('patients', {'is_active': True})
-            
-            # Debug output
-            print(f"DEBUG: Loaded {len(patients)} active patients from database")
-            
-            # Sort by patient ID
-            patients.sort(key=lambda x: x.get('patient_id', ''))
+    def _on_patient_select(self, event):
+        """Remember the selected patient so it stays selected while scrolling"""
+        selection = self.patients_tree.selection()
+        if selection:
+            self.patient_view.selected_iid = selection[0]
+    
+    def _on_search_text(self, new_text):
+        """
+        Schedule filtering when an edit changes the search term
+        
+        Args:
+            new_text: Entry text after the edit
             
-            displayed_count = 0
-            # Insert into treeview
-            for patient in patients:
-                # Apply search filter
-                if search_term:
-                    searchable = f"{patient.get('patient_id', '')} {patient.get('first_name', '')} {patient.get('last_name', '')} {patient.get('phone', '')} {patient.get('email', '')}".lower()
-                    if search_term not in searchable:
-                        continue
-                
-                full_name = f"{patient.get('first_name', '')} {patient.get('last_name', '')}"
-                
-                self.patients_tree.insert('', tk.END, values=(
-                    patient.get('patient_id', ''),
-                    full_name,
-                    patient.get('date_of_birth', ''),
-                    patient.get('gender', ''),
-                    patient.get('phone', ''),
-                    patient.get('email', ''),
-                    patient.get('blood_group', ''),
-                    patient.get('address', '')
-                ))
-                displayed_count += 1
-                print(f"DEBUG: Inserted patient {patient.get('patient_id')} - {full_name}")
+        Returns:
+            True, so the edit is always accepted
+        """
+        if new_text.strip() != self._last_search_term:
+            self._schedule_filter()
+        return True
+    
+    def _schedule_filter(self):
+        """Debounce search keystrokes so only the last one in a burst filters"""
+        if self._search_job:
+            self.window.after_cancel(self._search_job)
+        self._search_job = self.window.after(self.SEARCH_DELAY_MS, self.load_patients)
+    
+    def refresh_patients(self):
+        """Re-read patients from the database and redisplay them"""
+        self._patients_cache = None
+        self.load_patients()
+    
+    def _read_active_patients(self):
+        """Read active patients sorted by patient ID (safe to call off the Tk thread)"""
+        # Load patients - filter for active patients only, sorted by the database
+        patients = self.db.read('patients', {'is_active': True}, order_by='patient_id')
+        
+        logger.debug("Loaded %d active patients from database", len(patients))
+        return patients
+    
+    def _set_patients_cache(self, patients):
+        """Cache active patients, indexed by patient ID, with their display rows"""
+        self._patients_cache = patients
+        self._patients_by_id = {p['patient_id']: p for p in patients}
+        self._patient_rows = [self._patient_row(p) for p in patients]
+    
+    def load_patients(self):
+        """Load patients into treeview in the background, filtered by the search term"""
+        self._search_job = None
+        
+        # Get search term
+        search_term = self.search_entry.get().strip()
+        self._last_search_term = search_term
+        
+        # Results of a load superseded by a later one are dropped
+        self._load_generation += 1
+        
+        if self._patients_cache is not None and not search_term:
+            self._show_patients(self._patient_rows, search_term)
+            return
+        
+        generation = self._load_generation
+        needs_cache = self._patients_cache is None
+        
+        def read():
+            patients = self._read_active_patients() if needs_cache else None
             
-            # Update stats
-            total = len(patients)
+            # The database does the matching for a search term
+            matches = None
+            if search_term:
+                matches = self.db.read(
+                    'patients',
+                    {'is_active': True},
+                    order_by='patient_id',
+                    search=search_term,
+                    search_fields=self.SEARCH_FIELDS
+                )
+            return patients, matches
+        
+        def on_loaded(result):
+            if generation != self._load_generation:
+                return
+            patients, matches = result
+            if patients is not None:
+                self._set_patients_cache(patients)
             if search_term:
-                self.stats_label.config(text=f"Showing {displayed_count} of {total} patients")
+                # Matches are fresher than the cache and may include patients
+                # added since it was loaded, so details are shown from them
+                self._patients_by_id.update((p['patient_id'], p) for p in matches)
+                self._show_patients([self._patient_row(p) for p in matches], search_term)
             else:
-                self.stats_label.config(text=f"Total Patients: {total}")
-            
-            print(f"DEBUG: Display complete - {displayed_count} patients shown")
-            
-        except Exception as e:
-            print(f"ERROR in load_patients: {str(e)}")
-            import traceback
-            traceback.print_exc()
+                self._show_patients(self._patient_rows, search_term)
+        
+        def on_error(e):
+            logger.error("Failed to load patients", exc_info=e)
             messagebox.showerror("Error", f"Failed to load patients: {str(e)}")
+        
+        run_in_background(self.window, read, on_loaded, on_error)
+    
+    @staticmethod
+    def _patient_row(patient):
+        """Build the treeview row for a patient record"""
+        full_name = f"{patient['first_name']} {patient['last_name']}"
+        return (patient['patient_id'], full_name) + PatientRecordsWindow._detail_fields(patient)
+    
+    def _show_patients(self, rows, search_term):
+        """
+        Display patient rows in the treeview and update the stats line
+        
+        Args:
+            rows: Treeview rows to display; the virtual list only creates
+                items for those in view
+            search_term: Search term they were matched against, or ''
+        """
+        # Values may have changed since the last load, so drop the old items
+        self.patient_view.clear()
+        self.patient_view.show(rows)
+        displayed_count = len(rows)
+        
+        # Update stats, skipping the label redraw when the text is unchanged
+        total = len(self._patients_cache)
+        if search_term:
+            stats = f"Showing {displayed_count} of {total} patients"
+        else:
+            stats = f"Total Patients: {total}"
+        if stats != self._last_stats:
+            self.stats_label.config(text=stats)
+            self._last_stats = stats
+        
+        logger.debug("Display complete - %d patients shown", displayed_count)
     
     def show_context_menu(self, event):
         """Show context menu for patient"""
         item = self.patients_tree.identify_row(event.y)
         if item:
             self.patients_tree.selection_set(item)
-            menu = tk.Menu(self.window, tearoff=0, bg='#16213e', fg='#ffffff', font=('Segoe UI', 9))
-            menu.add_command(label="View Details", command=self.view_patient_details)
-            menu.add_command(label="Delete Patient", command=self.delete_patient)
-            menu.post(event.x_root, event.y_root)
+            self.context_menu.post(event.x_root, event.y_root)
     
     def view_patient_details(self, event=None):
         """View selected patient details"""
@@ -270,13 +353,16 @@ class PatientRecordsWindow:
         if not selection:
             return
         
-        values = self.patients_tree.item(selection[0])['values']
-        patient_id = values[0]
-        
-        patients = self.db.read('patients', {'patient_id': patient_id})
-        if patients:
-            patient = patients[0]
-            
+        # Item IDs are patient IDs; the row is usually already in memory
+        patient_id = selection[0]
+        patient = self._patients_by_id.get(patient_id)
+        if patient is None:
+            try:
+                patient = self.db.get_by_id('patients', patient_id)
+            except Exception as e:
+                messagebox.showerror("Error", f"Failed to load patient: {str(e)}", parent=self.window)
+                return
+        if patient:
             # Create details window
             details_window = tk.Toplevel(self.window)
             details_window.title(f"Patient Details - {patient_id}")
@@ -298,25 +384,43 @@ class PatientRecordsWindow:
                 fg='#3498db'
             ).pack(expand=True)
             
-            # Scrollable content
-            canvas = tk.Canvas(details_window, bg='#1a1a2e', highlightthickness=0)
-            scrollbar = tk.Scrollbar(details_window, orient='vertical', command=canvas.yview)
-            content_frame = tk.Frame(canvas, bg='#1a1a2e')
+            # Close button
+            close_btn = tk.Button(
+                details_window,
+                text="✖ Close",
+                font=('Segoe UI', 11, 'bold'),
+                bg='#95a5a6',
+                fg='white',
+                cursor='hand2',
+                relief='flat',
+                bd=0,
+                command=details_window.destroy
+            )
+            close_btn.pack(side='bottom', pady=20)
+            add_hover(close_btn, '#7f8c8d', '#95a5a6')
             
-            canvas.configure(yscrollcommand=scrollbar.set)
+            # Patient details, written into one read-only text widget
+            scrollbar = tk.Scrollbar(details_window, orient='vertical')
+            details_text = tk.Text(
+                details_window,
+                bg='#1a1a2e',
+                fg='#ffffff',
+                wrap='word',
+                relief='flat',
+                bd=0,
+                padx=20,
+                pady=10,
+                yscrollcommand=scrollbar.set
+            )
+            scrollbar.config(command=details_text.yview)
             scrollbar.pack(side='right', fill='y')
-            canvas.pack(side='left', fill='both', expand=True)
-            
-            canvas_window = canvas.create_window((0, 0), window=content_frame, anchor='nw')
-            
-            def configure_scroll(event):
-                canvas.configure(scrollregion=canvas.bbox('all'))
-                canvas.itemconfig(canvas_window, width=event.width)
+            details_text.pack(side='left', fill='both', expand=True)
             
-            content_frame.bind('<Configure>', lambda e: canvas.configure(scrollregion=canvas.bbox('all')))
-            canvas.bind('<Configure>', configure_scroll)
+            details_text.tag_configure('label', font=('Segoe UI', 10, 'bold'), foreground='#7f8c8d',
+                                       spacing1=10, spacing3=5)
+            details_text.tag_configure('value', font=('Segoe UI', 11), foreground='#ffffff',
+                                       spacing3=10)
             
-            # Patient details
             details = [
                 ("Patient ID", patient.get('patient_id', 'N/A')),
                 ("First Name", patient.get('first_name', 'N/A')),
@@ -330,44 +434,12 @@ class PatientRecordsWindow:
                 ("Emergency Contact", patient.get('emergency_contact', 'N/A')),
             ]
             
+            # Tagged text chunks go in with a single insert call
+            chunks = []
             for label, value in details:
-                detail_frame = tk.Frame(content_frame, bg='#16213e')
-                detail_frame.pack(fill='x', padx=20, pady=8)
-                
-                tk.Label(
-                    detail_frame,
-                    text=label + ":",
-                    font=('Segoe UI', 10, 'bold'),
-                    bg='#16213e',
-                    fg='#7f8c8d',
-                    anchor='w'
-                ).pack(anchor='w', padx=15, pady=(10, 5))
-                
-                tk.Label(
-                    detail_frame,
-                    text=str(value),
-                    font=('Segoe UI', 11),
-                    bg='#16213e',
-                    fg='#ffffff',
-                    anchor='w',
-                    wraplength=430
-                ).pack(anchor='w', padx=15, pady=(0, 10))
-            
-            # Close button
-            close_btn = tk.Button(
-                content_frame,
-                text="✖ Close",
-                font=('Segoe UI', 11, 'bold'),
-                bg='#95a5a6',
-                fg='white',
-                cursor='hand2',
-                relief='flat',
-                bd=0,
-                command=details_window.destroy
-            )
-            close_btn.pack(pady=20)
-            close_btn.bind('<Enter>', lambda e: close_btn.config(bg='#7f8c8d'))
-            close_btn.bind('<Leave>', lambda e: close_btn.config(bg='#95a5a6'))
+                chunks.extend((f"{label}:\n", 'label', f"{value}\n", 'value'))
+            details_text.insert('1.0', *chunks)
+            details_text.config(state='disabled')
     
     def delete_patient(self):
         """Delete selected patient"""
@@ -383,4 +455,4 @@ class PatientRecordsWindow:
                                f"Are you sure you want to delete patient '{patient_name}' (ID: {patient_id})?\n\nThis action cannot be undone."):
             self.db.delete('patients', patient_id, 'patient_id')
             messagebox.showinfo("Success", "Patient deleted successfully")
-            self.load_patients()
+            self.refresh_patients()
@@ -8,96 +8,184 @@ from tkinter import messagebox, ttk
 from datetime import datetime
 from app.services.patient_manager import PatientManager, PatientManagerException
 from app.utils.db_connector import DatabaseConnector
+from app.utils.background import run_in_background
+from app.utils.styles import add_hover, emoji_font, has_emoji_font, init_styles
+from app.utils.window import bind_mousewheel, bind_scrollregion, center_window
+
+# Form colours
+BG = '#1a1a2e'
+PANEL = '#16213e'
+FG = '#ffffff'
+FG_MUTED = '#7f8c8d'
+ACCENT = '#3498db'
+
+# Named fonts registered by init_styles
+FONT_LABEL = 'RegistrationBody'
+FONT_SECTION = 'RegistrationSection'
 
 
 class PatientRegistrationWindow:
     """Patient registration window"""
     
-    def __init__(self, db_connector: DatabaseConnector, patient_manager: PatientManager):
+    # Text fields per form section as (label, field name, height in lines);
+    # a height above one makes a multi-line Text instead of an Entry
+    PERSONAL_FIELDS = (
+        ("First Name *", "first_name", 1),
+        ("Last Name *", "last_name", 1),
+    )
+    CONTACT_FIELDS = (
+        ("Phone Number *", "phone", 1),
+        ("Email", "email", 1),
+        ("Address", "address", 3),
+    )
+    MEDICAL_FIELDS = (
+        ("Emergency Contact", "emergency_contact", 1),
+    )
+    
+    # Widget options shared by every field; labels and single-line inputs are
+    # themed ttk widgets whose look comes from the shared named styles
+    FIELD_LABEL_OPTIONS = {'style': 'Registration.TLabel'}
+    FIELD_ENTRY_OPTIONS = {'style': 'Registration.TEntry', 'font': FONT_LABEL}
+    
+    # Multi-line inputs stay tk.Text, which has no ttk counterpart; a thick
+    # highlight ring in the field colour pads the input
+    FIELD_TEXT_OPTIONS = {
+        'font': FONT_LABEL,
+        'bg': PANEL,
+        'fg': FG,
+        'relief': 'flat',
+        'bd': 0,
+        'insertbackground': ACCENT,
+        'highlightthickness': 10,
+        'highlightbackground': PANEL,
+        'highlightcolor': PANEL
+    }
+    
+    # Window kept hidden between openings, reused while its manager is current
+    _instance = None
+    
+    @classmethod
+    def open(cls, db_connector: DatabaseConnector, patient_manager: PatientManager,
+             master: tk.Misc = None) -> 'PatientRegistrationWindow':
+        """
+        Show the registration window, reusing the hidden one when possible
+        
+        Args:
+            db_connector: Database connector instance
+            patient_manager: Patient manager instance
+            master: Parent window
+            
+        Returns:
+            Registration window shown with an empty form
+        """
+        existing = cls._instance
+        try:
+            alive = existing is not None and bool(existing.window.winfo_exists())
+        except tk.TclError:
+            alive = False
+        
+        if alive and existing.patient_manager is patient_manager:
+            if existing.entries:
+                existing.clear_form()
+            existing.window.deiconify()
+            existing.window.lift()
+            return existing
+        
+        # A window left over from an earlier session is discarded
+        if alive:
+            existing.window.destroy()
+        cls._instance = cls(db_connector, patient_manager, master)
+        return cls._instance
+    
+    def __init__(self, db_connector: DatabaseConnector, patient_manager: PatientManager,
+                 master: tk.Misc = None):
         """
         Initialize patient registration window
         
         Args:
             db_connector: Database connector instance
             patient_manager: Patient manager instance
+            master: Parent window
         """
         self.db = db_connector
         self.patient_manager = patient_manager
         
-        self.window = tk.Toplevel()
+        # Text field widgets by field name, filled when the form is built,
+        # and the variables holding the single-line fields' text
+        self.entries = {}
+        self.vars = {}
+        
+        self.window = tk.Toplevel(master)
         self.window.title("Patient Registration")
-        self.window.geometry("700x700")
+        center_window(self.window, 700, 700)
         self.window.resizable(False, False)
+        self.window.configure(bg=BG)
         
-        # Center window
-        self._center_window()
+        # Theme, combobox style and named fonts (configured once per root)
+        init_styles(self.window)
         
-        # Create UI
-        self._create_widgets()
+        # Closing only hides the window so the next opening can reuse it
+        self.window.protocol("WM_DELETE_WINDOW", self.window.withdraw)
+        
+        # Create UI once the window is first shown, so opening it returns
+        # to the event loop straight away
+        self.window.bind('<Map>', self._on_first_map)
     
-    def _center_window(self):
-        """Center window on screen"""
-        self.window.update_idletasks()
-        width = self.window.winfo_width()
-        height = self.window.winfo_height()
-        x = (self.window.winfo_screenwidth() // 2) - (width // 2)
-        y = (self.window.winfo_screenheight() // 2) - (height // 2)
-        self.window.geometry(f'{width}x{height}+{x}+{y}')
+    def _on_first_map(self, event):
+        """Build the form the first time the window is mapped"""
+        # Children inherit the toplevel's bindings; only its own Map counts
+        if event.widget is not self.window:
+            return
+        self.window.unbind('<Map>')
+        self._create_widgets()
     
     def _create_widgets(self):
         """Create UI widgets"""
-        # Set window background
-        self.window.configure(bg='#1a1a2e')
-        
         # Header with modern styling
-        header_frame = tk.Frame(self.window, bg='#16213e', height=70)
+        header_frame = tk.Frame(self.window, bg=PANEL, height=70)
         header_frame.pack(fill='x')
         header_frame.pack_propagate(False)
         
         # Icon and title
-        header_content = tk.Frame(header_frame, bg='#16213e')
+        header_content = tk.Frame(header_frame, bg=PANEL)
         header_content.pack(expand=True)
         
-        icon_label = tk.Label(
-            header_content,
-            text="👤",
-            font=('Segoe UI Emoji', 24),
-            bg='#16213e',
-            fg='#3498db'
-        )
-        icon_label.pack(side='left', padx=(0, 15))
+        # The icon is skipped where emoji would need a slow font fallback
+        if has_emoji_font(self.window):
+            icon_label = tk.Label(
+                header_content,
+                text="👤",
+                font=emoji_font(self.window, 24),
+                bg=PANEL,
+                fg=ACCENT
+            )
+            icon_label.pack(side='left', padx=(0, 15))
         
         title_label = tk.Label(
             header_content,
             text="Patient Registration",
             font=('Segoe UI', 18, 'bold'),
-            bg='#16213e',
-            fg='#ffffff'
+            bg=PANEL,
+            fg=FG
         )
         title_label.pack(side='left')
         
         # Main form frame with scrollbar
-        main_frame = tk.Frame(self.window, bg='#1a1a2e')
+        main_frame = tk.Frame(self.window, bg=BG)
         main_frame.pack(fill='both', expand=True, padx=20, pady=20)
         
         # Canvas for scrolling
-        canvas = tk.Canvas(main_frame, bg='#1a1a2e', highlightthickness=0)
+        canvas = tk.Canvas(main_frame, bg=BG, highlightthickness=0)
         scrollbar = ttk.Scrollbar(main_frame, orient='vertical', command=canvas.yview)
-        scrollable_frame = tk.Frame(canvas, bg='#1a1a2e')
+        scrollable_frame = tk.Frame(canvas, bg=BG)
         
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
+        bind_scrollregion(canvas, scrollable_frame)
         
         canvas.create_window((0, 0), window=scrollable_frame, anchor='nw')
         canvas.configure(yscrollcommand=scrollbar.set)
         
-        # Enable mouse wheel scrolling
-        def _on_mousewheel(event):
-            canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-        
-        canvas.bind_all("<MouseWheel>", _on_mousewheel)
+        # Scroll with the mouse wheel while the pointer is over the canvas
+        bind_mousewheel(canvas)
         
         # Form fields
         self._create_form_fields(scrollable_frame)
@@ -106,10 +194,10 @@ class PatientRegistrationWindow:
         scrollbar.pack(side='right', fill='y')
         
         # Buttons frame
-        button_frame = tk.Frame(self.window, bg='#1a1a2e')
+        button_frame = tk.Frame(self.window, bg=BG)
         button_frame.pack(fill='x', padx=20, pady=(0, 20))
         
-        register_btn = tk.Button(
+        self.register_btn = tk.Button(
             button_frame,
             text="✓ Register Patient",
             font=('Segoe UI', 12, 'bold'),
@@ -124,9 +212,8 @@ class PatientRegistrationWindow:
             bd=0,
             command=self.register_patient
         )
-        register_btn.pack(side='left', padx=(0, 10))
-        register_btn.bind('<Enter>', lambda e: register_btn.config(bg='#27ae60'))
-        register_btn.bind('<Leave>', lambda e: register_btn.config(bg='#2ecc71'))
+        self.register_btn.pack(side='left', padx=(0, 10))
+        add_hover(self.register_btn, '#27ae60', '#2ecc71')
         
         clear_btn = tk.Button(
             button_frame,
@@ -144,8 +231,7 @@ class PatientRegistrationWindow:
             command=self.clear_form
         )
         clear_btn.pack(side='left')
-        clear_btn.bind('<Enter>', lambda e: clear_btn.config(bg='#2c3e50'))
-        clear_btn.bind('<Leave>', lambda e: clear_btn.config(bg='#34495e'))
+        add_hover(clear_btn, '#2c3e50', '#34495e')
     
     def _create_form_fields(self, parent):
         """Create form input fields"""
@@ -153,59 +239,32 @@ class PatientRegistrationWindow:
         section_label = tk.Label(
             parent,
             text="📋 Personal Information",
-            font=('Segoe UI', 13, 'bold'),
-            bg='#1a1a2e',
-            fg='#3498db'
+            font=FONT_SECTION,
+            bg=BG,
+            fg=ACCENT
         )
         section_label.pack(anchor='w', pady=(10, 15))
         
-        # First Name
-        self._create_field(parent, "First Name *", "first_name")
-        
-        # Last Name
-        self._create_field(parent, "Last Name *", "last_name")
+        self._create_fields(parent, self.PERSONAL_FIELDS)
         
         # Date of Birth
-        dob_frame = tk.Frame(parent, bg='#1a1a2e')
+        dob_frame = tk.Frame(parent, bg=BG)
         dob_frame.pack(fill='x', pady=8)
         
-        tk.Label(
-            dob_frame,
-            text="Date of Birth * (YYYY-MM-DD):",
-            font=('Segoe UI', 10),
-            bg='#1a1a2e',
-            fg='#7f8c8d'
-        ).pack(anchor='w')
-        
-        entry_bg = tk.Frame(dob_frame, bg='#16213e', relief='flat')
-        entry_bg.pack(fill='x', pady=(5, 0))
-        
-        self.dob_entry = tk.Entry(
-            entry_bg,
-            font=('Segoe UI', 10),
-            bg='#16213e',
-            fg='#ffffff',
-            relief='flat',
-            bd=0,
-            insertbackground='#3498db'
-        )
-        self.dob_entry.pack(fill='x', padx=10, pady=10)
-        self.dob_entry.insert(0, "2000-01-01")
+        ttk.Label(dob_frame, text="Date of Birth * (YYYY-MM-DD):", **self.FIELD_LABEL_OPTIONS).pack(anchor='w')
+        
+        self.dob_var = tk.StringVar(self.window, value="2000-01-01")
+        self.dob_entry = ttk.Entry(dob_frame, textvariable=self.dob_var, **self.FIELD_ENTRY_OPTIONS)
+        self.dob_entry.pack(fill='x', pady=(5, 0))
         
         # Gender
-        gender_frame = tk.Frame(parent, bg='#1a1a2e')
+        gender_frame = tk.Frame(parent, bg=BG)
         gender_frame.pack(fill='x', pady=8)
         
-        tk.Label(
-            gender_frame,
-            text="Gender *:",
-            font=('Segoe UI', 10),
-            bg='#1a1a2e',
-            fg='#7f8c8d'
-        ).pack(anchor='w')
+        ttk.Label(gender_frame, text="Gender *:", **self.FIELD_LABEL_OPTIONS).pack(anchor='w')
         
         self.gender_var = tk.StringVar(value="Male")
-        gender_options = tk.Frame(gender_frame, bg='#1a1a2e')
+        gender_options = tk.Frame(gender_frame, bg=BG)
         gender_options.pack(anchor='w', pady=(5, 0))
         
         for gender in ['Male', 'Female', 'Other']:
@@ -214,182 +273,146 @@ class PatientRegistrationWindow:
                 text=gender,
                 variable=self.gender_var,
                 value=gender,
-                font=('Segoe UI', 10),
-                bg='#1a1a2e',
-                fg='#ffffff',
-                selectcolor='#16213e',
-                activebackground='#1a1a2e',
-                activeforeground='#ffffff'
+                font=FONT_LABEL,
+                bg=BG,
+                fg=FG,
+                selectcolor=PANEL,
+                activebackground=BG,
+                activeforeground=FG
             ).pack(side='left', padx=(0, 15))
         
         # Contact Information
         section_label = tk.Label(
             parent,
             text="📞 Contact Information",
-            font=('Segoe UI', 13, 'bold'),
-            bg='#1a1a2e',
-            fg='#3498db'
+            font=FONT_SECTION,
+            bg=BG,
+            fg=ACCENT
         )
         section_label.pack(anchor='w', pady=(20, 15))
         
-        # Phone
-        self._create_field(parent, "Phone Number *", "phone")
-        
-        # Email
-        self._create_field(parent, "Email", "email")
-        
-        # Address
-        self._create_field(parent, "Address", "address", height=3)
+        self._create_fields(parent, self.CONTACT_FIELDS)
         
         # Medical Information
         section_label = tk.Label(
             parent,
             text="🏥 Medical Information",
-            font=('Segoe UI', 13, 'bold'),
-            bg='#1a1a2e',
-            fg='#3498db'
+            font=FONT_SECTION,
+            bg=BG,
+            fg=ACCENT
         )
         section_label.pack(anchor='w', pady=(20, 15))
         
         # Blood Group
-        blood_frame = tk.Frame(parent, bg='#1a1a2e')
+        blood_frame = tk.Frame(parent, bg=BG)
         blood_frame.pack(fill='x', pady=8)
         
-        tk.Label(
-            blood_frame,
-            text="Blood Group:",
-            font=('Segoe UI', 10),
-            bg='#1a1a2e',
-            fg='#7f8c8d'
-        ).pack(anchor='w')
+        ttk.Label(blood_frame, text="Blood Group:", **self.FIELD_LABEL_OPTIONS).pack(anchor='w')
         
         self.blood_group_var = tk.StringVar()
         
-        # Style the combobox
-        style = ttk.Style()
-        style.theme_use('default')
-        style.configure('Dark.TCombobox', 
-                       fieldbackground='#16213e',
-                       background='#16213e',
-                       foreground='#ffffff',
-                       arrowcolor='#3498db')
-        
         blood_combo = ttk.Combobox(
             blood_frame,
             textvariable=self.blood_group_var,
             values=['', 'A+', 'A-', 'B+', 'B-', 'AB+', 'AB-', 'O+', 'O-'],
             state='readonly',
-            font=('Segoe UI', 10),
-            style='Dark.TCombobox'
+            font=FONT_LABEL,
+            style='Registration.TCombobox'
         )
         blood_combo.pack(fill='x', pady=(5, 0))
         blood_combo.set('')
         
-        # Emergency Contact
-        self._create_field(parent, "Emergency Contact", "emergency_contact")
+        self._create_fields(parent, self.MEDICAL_FIELDS)
     
-    def _create_field(self, parent, label_text, field_name, height=1):
-        """Create a form field"""
-        field_frame = tk.Frame(parent, bg='#1a1a2e')
-        field_frame.pack(fill='x', pady=8)
-        
-        label = tk.Label(
-            field_frame,
-            text=label_text + ":",
-            font=('Segoe UI', 10),
-            bg='#1a1a2e',
-            fg='#7f8c8d'
-        )
-        label.pack(anchor='w')
-        
-        entry_bg = tk.Frame(field_frame, bg='#16213e', relief='flat')
-        entry_bg.pack(fill='x', pady=(5, 0))
-        
-        if height > 1:
-            entry = tk.Text(
-                entry_bg,
-                font=('Segoe UI', 10),
-                bg='#16213e',
-                fg='#ffffff',
-                relief='flat',
-                bd=0,
-                height=height,
-                insertbackground='#3498db'
-            )
-        else:
-            entry = tk.Entry(
-                entry_bg,
-                font=('Segoe UI', 10),
-                bg='#16213e',
-                fg='#ffffff',
-                relief='flat',
-                bd=0,
-                insertbackground='#3498db'
-            )
+    def _create_fields(self, parent, specs):
+        """
+        Create a run of labelled text fields
+        
+        Args:
+            parent: Frame to pack the fields into
+            specs: (label, field name, height) tuples; see PERSONAL_FIELDS
+        """
+        Label, Entry, Text, StringVar = ttk.Label, ttk.Entry, tk.Text, tk.StringVar
+        label_options = self.FIELD_LABEL_OPTIONS
+        entry_options = self.FIELD_ENTRY_OPTIONS
+        text_options = self.FIELD_TEXT_OPTIONS
+        entries = self.entries
+        variables = self.vars
+        
+        for label_text, field_name, height in specs:
+            Label(parent, text=label_text + ":", **label_options).pack(anchor='w', pady=(8, 0))
+            
+            if height > 1:
+                entry = Text(parent, height=height, **text_options)
+            else:
+                var = variables[field_name] = StringVar(self.window)
+                entry = Entry(parent, textvariable=var, **entry_options)
+            
+            entry.pack(fill='x', pady=(5, 8))
+            entries[field_name] = entry
+    
+    def _collect_fields(self):
+        """
+        Read every text field of the form
         
-        entry.pack(fill='x', padx=10, pady=10)
-        setattr(self, f"{field_name}_entry", entry)
+        Returns:
+            Stripped value by field name, None for empty fields
+        """
+        values = {name: var.get().strip() or None for name, var in self.vars.items()}
+        
+        # Multi-line fields have no variable
+        for field_name, entry in self.entries.items():
+            if field_name not in values:
+                values[field_name] = entry.get("1.0", "end-1c").strip() or None
+        return values
     
     def register_patient(self):
-        """Handle patient registration"""
-        try:
-            # Get form values
-            first_name = self.first_name_entry.get().strip()
-            last_name = self.last_name_entry.get().strip()
-            dob = self.dob_entry.get().strip()
-            gender = self.gender_var.get()
-            phone = self.phone_entry.get().strip()
-            email = self.email_entry.get().strip() or None
-            address = self.address_entry.get("1.0", tk.END).strip() or None
-            blood_group = self.blood_group_var.get() or None
-            emergency_contact = self.emergency_contact_entry.get().strip() or None
-            
-            # Register patient
-            patient = self.patient_manager.register_patient(
-                first_name=first_name,
-                last_name=last_name,
-                date_of_birth=dob,
+        """Handle patient registration, saving in the background"""
+        # Get form values
+        fields = self._collect_fields()
+        date_of_birth = self.dob_var.get().strip()
+        gender = self.gender_var.get()
+        blood_group = self.blood_group_var.get() or None
+        
+        # Register patient off the Tk thread; the button stays disabled
+        # until the outcome is shown, so a double click registers once
+        self.register_btn.config(state='disabled')
+        run_in_background(
+            self.window,
+            lambda: self.patient_manager.register_patient(
+                date_of_birth=date_of_birth,
                 gender=gender,
-                phone=phone,
-                email=email,
-                address=address,
                 blood_group=blood_group,
-                emergency_contact=emergency_contact
-            )
-            
-            # Ensure window stays on top for messagebox
-            self.window.lift()
-            self.window.focus_force()
-            
-            messagebox.showinfo(
-                "Success",
-                f"Patient registered successfully!\n\nPatient ID: {patient.patient_id}\nName: {patient.full_name}",
-                parent=self.window
-            )
-            
-            self.clear_form()
-            
-        except PatientManagerException as e:
-            # Keep window open and show error
-            self.window.lift()
-            self.window.focus_force()
-            messagebox.showerror("Registration Failed", str(e), parent=self.window)
-        except Exception as e:
-            # Keep window open and show error
-            self.window.lift()
-            self.window.focus_force()
-            messagebox.showerror("Error", f"An error occurred: {str(e)}", parent=self.window)
+                **fields
+            ),
+            self._on_registered,
+            self._on_register_failed
+        )
+    
+    def _on_registered(self, patient):
+        """Report a successful registration and reset the form"""
+        self.register_btn.config(state='normal')
+        messagebox.showinfo(
+            "Success",
+            f"Patient registered successfully!\n\nPatient ID: {patient.patient_id}\nName: {patient.full_name}",
+            parent=self.window
+        )
+        self.clear_form()
+    
+    def _on_register_failed(self, error):
+        """Report a failed registration, keeping the form contents"""
+        self.register_btn.config(state='normal')
+        if isinstance(error, PatientManagerException):
+            messagebox.showerror("Registration Failed", str(error), parent=self.window)
+        else:
+            messagebox.showerror("Error", f"An error occurred: {str(error)}", parent=self.window)
     
     def clear_form(self):
         """Clear all form fields"""
-        self.first_name_entry.delete(0, tk.END)
-        self.last_name_entry.delete(0, tk.END)
-        self.dob_entry.delete(0, tk.END)
-        self.dob_entry.insert(0, "2000-01-01")
+        for var in self.vars.values():
+            var.set('')
+        self.entries['address'].delete("1.0", tk.END)
+        self.dob_var.set("2000-01-01")
         self.gender_var.set("Male")
-        self.phone_entry.delete(0, tk.END)
-        self.email_entry.delete(0, tk.END)
-        self.address_entry.delete("1.0", tk.END)
         self.blood_group_var.set('')
-        self.emergency_contact_entry.delete(0, tk.END)
-        self.first_name_entry.focus()
+        self.entries['first_name'].focus()
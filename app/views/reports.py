@@ -3,54 +3,88 @@ Reports Window - Generate and view various reports
 Displays patient, appointment, financial, and statistical reports
 """
 
+import functools
+import heapq
+import logging
 import tkinter as tk
+from collections import OrderedDict
+from operator import itemgetter
 from tkinter import ttk, messagebox
 from datetime import datetime, timedelta
 from app.services.report_generator import ReportGenerator
+from app.utils.background import run_in_background
+from app.utils.styles import emoji_font
+from app.utils.window import bind_mousewheel, bind_scrollregion, center_window
+
+logger = logging.getLogger(__name__)
+
+# Separator lines of the text report
+_REPORT_RULE = '=' * 80 + '\n'
+_REPORT_DIVIDER = '\n' + '-' * 80 + '\n\n'
+
+
+@functools.lru_cache(maxsize=128)
+def _darken_color(hex_color):
+    """Darken a hex color by 20%"""
+    hex_color = hex_color.lstrip('#')
+    rgb = tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+    darkened = tuple(int(c * 0.8) for c in rgb)
+    return f"#{darkened[0]:02x}{darkened[1]:02x}{darkened[2]:02x}"
 
 
 class ReportsWindow:
     """Reports generation and viewing window"""
     
-    def __init__(self, db_connector):
+    # Most generated reports kept for repeat requests with the same range
+    REPORT_CACHE_SIZE = 16
+    
+    # Report keys left out of the text export and view (headers, raw records, errors)
+    EXPORT_SKIPPED_KEYS = frozenset({
+        'report_type', 'generated_at', 'period', 'patients', 'appointments', 'bills', 'error'
+    })
+    
+    # Height in pixels of one labelled progress bar row
+    PROGRESS_ROW_HEIGHT = 49
+    
+    def __init__(self, db_connector, master=None):
         """
         Initialize reports window
         
         Args:
             db_connector: Database connector instance
+            master: Parent window
         """
         try:
-            print("DEBUG: Initializing Reports Window...")
             self.db = db_connector
             self.report_generator = ReportGenerator(db_connector)
             self.current_report = None
             
-            self.window = tk.Toplevel()
+            # (report type, start, end) -> report, least recently used first
+            self._report_cache = OrderedDict()
+            self._last_generate = None
+            
+            # Distribution sections kept across reports, and how many are shown
+            self._section_pool = []
+            self._sections_shown = 0
+            
+            # Set while a report is generated; its buttons are disabled meanwhile
+            self._generating = False
+            self.report_buttons = []
+            
+            # Whether the text view is shown in place of the charts
+            self._showing_text = False
+            
+            self.window = tk.Toplevel(master)
             self.window.title("Reports & Analytics")
-            self.window.geometry("1400x800")
+            center_window(self.window, 1400, 800)
             self.window.configure(bg='#1a1a2e')
             
-            # Center window
-            self._center_window()
-            
             # Create UI
             self._create_widgets()
-            print("DEBUG: Reports Window initialized successfully")
         except Exception as e:
-            print(f"ERROR: Failed to initialize Reports Window: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            logger.error("Failed to initialize Reports Window", exc_info=e)
             messagebox.showerror("Error", f"Failed to open reports: {str(e)}")
     
-    def _center_window(self):
-        """Center window on screen"""
-        self.window.update_idletasks()
-        width = self.window.winfo_width()
-        height = self.window.winfo_height()
-        x = (self.window.winfo_screenwidth() // 2) - (width // 2)
-        y = (self.window.winfo_screenheight() // 2) - (height // 2)
-        self.window.geometry(f'{width}x{height}+{x}+{y}')
-    
     def _create_widgets(self):
         """Create UI widgets"""
         # Header
@@ -65,7 +99,7 @@ class ReportsWindow:
         icon_label = tk.Label(
             header_content,
             text="📊",
-            font=('Segoe UI Emoji', 24),
+            font=emoji_font(self.window, 24),
             bg='#16213e',
             fg='#3498db'
         )
@@ -146,7 +180,9 @@ class ReportsWindow:
             fg='#7f8c8d'
         ).pack(anchor='w', pady=(5, 2))
         
-        self.start_date_var = tk.StringVar(value=(datetime.now() - timedelta(days=30)).strftime("%Y-%m-%d"))
+        # Default range: the last 30 days, from a single clock reading
+        now = datetime.now()
+        self.start_date_var = tk.StringVar(value=(now - timedelta(days=30)).strftime("%Y-%m-%d"))
         start_date_entry = tk.Entry(
             date_frame,
             textvariable=self.start_date_var,
@@ -168,7 +204,7 @@ class ReportsWindow:
             fg='#7f8c8d'
         ).pack(anchor='w', pady=(5, 2))
         
-        self.end_date_var = tk.StringVar(value=datetime.now().strftime("%Y-%m-%d"))
+        self.end_date_var = tk.StringVar(value=now.strftime("%Y-%m-%d"))
         end_date_entry = tk.Entry(
             date_frame,
             textvariable=self.end_date_var,
@@ -199,12 +235,13 @@ class ReportsWindow:
                 font=('Segoe UI', 11, 'bold'),
                 bg=color,
                 fg='white',
-                activebackground=self._darken_color(color),
+                activebackground=_darken_color(color),
                 cursor='hand2',
                 relief='flat',
                 command=command
             )
             btn.pack(fill='x', padx=20, pady=5, ipady=12)
+            self.report_buttons.append(btn)
         
         # Separator
         ttk.Separator(parent, orient='horizontal').pack(fill='x', padx=20, pady=20)
@@ -222,6 +259,35 @@ class ReportsWindow:
             command=self.export_report
         )
         export_btn.pack(fill='x', padx=20, pady=5, ipady=10)
+        
+        # Refresh button; reports are cached per date range until refreshed
+        refresh_btn = tk.Button(
+            parent,
+            text="⟳ Refresh Report",
+            font=('Segoe UI', 10, 'bold'),
+            bg='#34495e',
+            fg='white',
+            activebackground='#2c3e50',
+            cursor='hand2',
+            relief='flat',
+            command=self.refresh_report
+        )
+        refresh_btn.pack(fill='x', padx=20, pady=5, ipady=10)
+        self.report_buttons.append(refresh_btn)
+        
+        # Switches the display between the charts and a plain text view
+        self.view_toggle_btn = tk.Button(
+            parent,
+            text="📄 Text View",
+            font=('Segoe UI', 10, 'bold'),
+            bg='#34495e',
+            fg='white',
+            activebackground='#2c3e50',
+            cursor='hand2',
+            relief='flat',
+            command=self.toggle_text_view
+        )
+        self.view_toggle_btn.pack(fill='x', padx=20, pady=5, ipady=10)
     
     def _create_report_display(self, parent):
         """Create report display panel"""
@@ -250,6 +316,7 @@ class ReportsWindow:
         # Canvas with scrollbar for report content
         canvas_container = tk.Frame(parent, bg='#16213e')
         canvas_container.pack(fill='both', expand=True, padx=20, pady=(0, 20))
+        self.chart_view = canvas_container
         
         canvas = tk.Canvas(canvas_container, bg='#16213e', highlightthickness=0)
         scrollbar = tk.Scrollbar(canvas_container, orient='vertical', command=canvas.yview)
@@ -262,19 +329,16 @@ class ReportsWindow:
         
         canvas_window = canvas.create_window((0, 0), window=self.report_frame, anchor='nw')
         
-        def configure_scroll_region(event):
-            canvas.configure(scrollregion=canvas.bbox('all'))
-            canvas_width = event.width
-            canvas.itemconfig(canvas_window, width=canvas_width)
-        
-        self.report_frame.bind('<Configure>', lambda e: canvas.configure(scrollregion=canvas.bbox('all')))
-        canvas.bind('<Configure>', configure_scroll_region)
+        def fit_width(event):
+            # Resizing the frame fires its <Configure>, which refits the
+            # scrollregion once Tk is idle
+            canvas.itemconfig(canvas_window, width=event.width)
         
-        # Enable mousewheel scrolling
-        def _on_mousewheel(event):
-            canvas.yview_scroll(int(-1*(event.delta/120)), "units")
+        bind_scrollregion(canvas, self.report_frame)
+        canvas.bind('<Configure>', fit_width)
         
-        canvas.bind_all("<MouseWheel>", _on_mousewheel)
+        # Scroll with the mouse wheel while the pointer is over the canvas
+        bind_mousewheel(canvas)
         
         # Welcome message
         welcome_label = tk.Label(
@@ -292,73 +356,200 @@ class ReportsWindow:
             justify='left'
         )
         welcome_label.pack(pady=50, padx=30)
+        
+        # Plain text view of the same report, packed in place of the charts
+        self.text_view = tk.Frame(parent, bg='#16213e')
+        self.report_text = tk.Text(
+            self.text_view,
+            font=('Courier New', 10),
+            bg='#16213e',
+            fg='#ffffff',
+            relief='flat',
+            highlightthickness=0,
+            wrap='none',
+            state='disabled'
+        )
+        text_scrollbar = tk.Scrollbar(self.text_view, orient='vertical', command=self.report_text.yview)
+        self.report_text.configure(yscrollcommand=text_scrollbar.set)
+        text_scrollbar.pack(side='right', fill='y')
+        self.report_text.pack(side='left', fill='both', expand=True)
+        
+        self.report_text.tag_configure('header', font=('Courier New', 14, 'bold'), foreground='#3498db')
+        self.report_text.tag_configure('muted', foreground='#7f8c8d')
+        self.report_text.tag_configure('body', foreground='#ffffff')
     
     def generate_patient_report(self):
         """Generate patient summary report"""
-        try:
-            print("DEBUG: Generating patient report...")
-            start_date = self.start_date_var.get()
-            end_date = self.end_date_var.get()
-            
-            self.current_report = self.report_generator.generate_patient_summary_report(start_date, end_date)
-            print(f"DEBUG: Patient report generated: {self.current_report.get('total_patients', 0)} patients")
-            self._display_patient_report()
-        except Exception as e:
-            print(f"ERROR: Failed to generate patient report: {str(e)}")
-            import traceback
-            traceback.print_exc()
-            messagebox.showerror("Error", f"Failed to generate patient report: {str(e)}")
+        start_date = self.start_date_var.get()
+        end_date = self.end_date_var.get()
+        self._last_generate = self.generate_patient_report
+        self._generate(
+            'patient',
+            (start_date, end_date),
+            lambda: self.report_generator.generate_patient_summary_report(start_date, end_date),
+            self._display_patient_report
+        )
     
     def generate_appointment_report(self):
         """Generate appointment report"""
-        try:
-            print("DEBUG: Generating appointment report...")
-            start_date = self.start_date_var.get()
-            end_date = self.end_date_var.get()
-            
-            self.current_report = self.report_generator.generate_appointment_report(start_date, end_date)
-            print(f"DEBUG: Appointment report generated: {self.current_report.get('total_appointments', 0)} appointments")
-            self._display_appointment_report()
-        except Exception as e:
-            print(f"ERROR: Failed to generate appointment report: {str(e)}")
-            import traceback
-            traceback.print_exc()
-            messagebox.showerror("Error", f"Failed to generate appointment report: {str(e)}")
+        start_date = self.start_date_var.get()
+        end_date = self.end_date_var.get()
+        self._last_generate = self.generate_appointment_report
+        self._generate(
+            'appointment',
+            (start_date, end_date),
+            lambda: self.report_generator.generate_appointment_report(start_date, end_date),
+            self._display_appointment_report
+        )
     
     def generate_financial_report(self):
         """Generate financial report"""
+        start_date = self.start_date_var.get()
+        end_date = self.end_date_var.get()
+        self._last_generate = self.generate_financial_report
+        self._generate(
+            'financial',
+            (start_date, end_date),
+            lambda: self.report_generator.generate_financial_report(start_date, end_date),
+            self._display_financial_report
+        )
+    
+    def generate_department_report(self):
+        """Generate department report"""
+        self._last_generate = self.generate_department_report
+        self._generate(
+            'department',
+            (),
+            self.report_generator.generate_department_report,
+            self._display_department_report
+        )
+    
+    def _generate(self, report_type, date_range, build, display):
+        """
+        Show a report from the cache, or build it in the background
+        
+        The report queries run in a worker thread so the window keeps
+        repainting and scrolling while they run.
+        
+        Args:
+            report_type: Report type name, used in the cache key and errors
+            date_range: (start, end) dates, or () for undated reports
+            build: Callable generating the report
+            display: Display method for the report
+        """
+        if not self._begin_generating():
+            return
+        
+        # Until a callback takes over, any failure must re-enable the buttons
         try:
-            print("DEBUG: Generating financial report...")
-            start_date = self.start_date_var.get()
-            end_date = self.end_date_var.get()
+            key = (report_type,) + date_range
+            report = self._report_cache.get(key)
+            if report is not None:
+                self._report_cache.move_to_end(key)
+                self._on_report_ready(key, report, display)
+                return
             
-            self.current_report = self.report_generator.generate_financial_report(start_date, end_date)
-            print(f"DEBUG: Financial report generated: Revenue {self.current_report.get('total_revenue', 0)}")
-            self._display_financial_report()
+            # Nothing to export until the new report arrives
+            self.current_report = None
+            if self._showing_text:
+                self._render_text_view()
+            self._clear_report()
+            self.report_title.config(text="Generating report...")
+            self.report_timestamp.config(text="")
+            tk.Label(
+                self.report_frame,
+                text="⏳ Generating report...",
+                font=('Segoe UI', 11),
+                bg='#16213e',
+                fg='#7f8c8d'
+            ).pack(pady=50)
+            
+            run_in_background(
+                self.window,
+                build,
+                lambda report: self._on_report_ready(key, report, display),
+                lambda e: self._on_report_failed(report_type, e)
+            )
         except Exception as e:
-            print(f"ERROR: Failed to generate financial report: {str(e)}")
-            import traceback
-            traceback.print_exc()
-            messagebox.showerror("Error", f"Failed to generate financial report: {str(e)}")
+            self._end_generating()
+            messagebox.showerror("Error", f"Failed to generate {report_type} report: {str(e)}",
+                                 parent=self.window)
     
-    def generate_department_report(self):
-        """Generate department report"""
+    def _on_report_ready(self, key, report, display):
+        """
+        Cache and display a generated report
+        
+        Args:
+            key: Report type and date range
+            report: Report data
+            display: Display method for the report
+        """
         try:
-            print("DEBUG: Generating department report...")
-            self.current_report = self.report_generator.generate_department_report()
-            print(f"DEBUG: Department report generated successfully")
-            self._display_department_report()
+            # Failed reports come back with an 'error' key; retry those next time
+            if 'error' not in report and key not in self._report_cache:
+                self._report_cache[key] = report
+                if len(self._report_cache) > self.REPORT_CACHE_SIZE:
+                    self._report_cache.popitem(last=False)
+            
+            self.current_report = report
+            display()
+            if self._showing_text:
+                self._render_text_view()
         except Exception as e:
-            print(f"ERROR: Failed to generate department report: {str(e)}")
-            import traceback
-            traceback.print_exc()
-            messagebox.showerror("Error", f"Failed to generate department report: {str(e)}")
+            messagebox.showerror("Error", f"Failed to display report: {str(e)}", parent=self.window)
+        finally:
+            self._end_generating()
+    
+    def _on_report_failed(self, report_type, error):
+        """
+        Report a generation failure
+        
+        Args:
+            report_type: Report type name
+            error: Exception raised while generating
+        """
+        self._clear_report()
+        self.report_title.config(text="Select a report type to generate")
+        self._end_generating()
+        messagebox.showerror("Error", f"Failed to generate {report_type} report: {str(error)}",
+                             parent=self.window)
+    
+    def _begin_generating(self):
+        """
+        Mark a report as being generated and disable the report buttons
+        
+        Returns:
+            False if a report is already being generated
+        """
+        if self._generating:
+            return False
+        self._generating = True
+        for btn in self.report_buttons:
+            btn.config(state='disabled')
+        return True
+    
+    def _end_generating(self):
+        """Re-enable the report buttons once pending events are handled"""
+        def finish():
+            self._generating = False
+            for btn in self.report_buttons:
+                btn.config(state='normal')
+        
+        # Clicks queued while a report was displayed are handled before idle
+        # callbacks, so they reach the still-disabled buttons and are dropped
+        self.window.after_idle(finish)
+    
+    def refresh_report(self):
+        """Regenerate the last report from current data"""
+        if self._last_generate is None:
+            return
+        # Cached reports may all be stale by now, not only this one
+        self._report_cache.clear()
+        self._last_generate()
     
     def _display_patient_report(self):
         """Display patient summary report"""
-        # Clear existing content
-        for widget in self.report_frame.winfo_children():
-            widget.destroy()
+        self._clear_report()
         
         report = self.current_report
         
@@ -383,52 +574,20 @@ class ReportsWindow:
         self._create_stat_card(stats_frame, "Total Patients", report['total_patients'], '#3498db', 0)
         
         # Gender distribution
-        gender_frame = tk.LabelFrame(
-            self.report_frame,
-            text="👥 Gender Distribution",
-            font=('Segoe UI', 12, 'bold'),
-            bg='#1a1a2e',
-            fg='#3498db',
-            relief='flat'
-        )
-        gender_frame.pack(fill='x', padx=20, pady=10)
-        
-        for gender, count in report['gender_distribution'].items():
-            self._create_progress_bar(gender_frame, gender, count, report['total_patients'])
+        self._show_distribution("👥 Gender Distribution", '#3498db',
+                                report['gender_distribution'].items(), report['total_patients'])
         
         # Blood group distribution
-        blood_frame = tk.LabelFrame(
-            self.report_frame,
-            text="🩸 Blood Group Distribution",
-            font=('Segoe UI', 12, 'bold'),
-            bg='#1a1a2e',
-            fg='#e74c3c',
-            relief='flat'
-        )
-        blood_frame.pack(fill='x', padx=20, pady=10)
-        
-        for blood_group, count in report['blood_group_distribution'].items():
-            self._create_progress_bar(blood_frame, blood_group, count, report['total_patients'])
+        self._show_distribution("🩸 Blood Group Distribution", '#e74c3c',
+                                report['blood_group_distribution'].items(), report['total_patients'])
         
         # Age distribution
-        age_frame = tk.LabelFrame(
-            self.report_frame,
-            text="📈 Age Distribution",
-            font=('Segoe UI', 12, 'bold'),
-            bg='#1a1a2e',
-            fg='#9b59b6',
-            relief='flat'
-        )
-        age_frame.pack(fill='x', padx=20, pady=10)
-        
-        for age_range, count in report['age_distribution'].items():
-            self._create_progress_bar(age_frame, age_range, count, report['total_patients'])
+        self._show_distribution("📈 Age Distribution", '#9b59b6',
+                                report['age_distribution'].items(), report['total_patients'])
     
     def _display_appointment_report(self):
         """Display appointment report"""
-        # Clear existing content
-        for widget in self.report_frame.winfo_children():
-            widget.destroy()
+        self._clear_report()
         
         report = self.current_report
         
@@ -453,38 +612,19 @@ class ReportsWindow:
         self._create_stat_card(stats_frame, "Total Appointments", report['total_appointments'], '#9b59b6', 0)
         
         # Status distribution
-        status_frame = tk.LabelFrame(
-            self.report_frame,
-            text="📊 Appointment Status",
-            font=('Segoe UI', 12, 'bold'),
-            bg='#1a1a2e',
-            fg='#9b59b6',
-            relief='flat'
+        self._show_distribution(
+            "📊 Appointment Status", '#9b59b6',
+            [(status.title(), count) for status, count in report['status_distribution'].items()],
+            report['total_appointments']
         )
-        status_frame.pack(fill='x', padx=20, pady=10)
-        
-        for status, count in report['status_distribution'].items():
-            self._create_progress_bar(status_frame, status.title(), count, report['total_appointments'])
         
         # Department distribution
-        dept_frame = tk.LabelFrame(
-            self.report_frame,
-            text="🏥 Department-wise Appointments",
-            font=('Segoe UI', 12, 'bold'),
-            bg='#1a1a2e',
-            fg='#3498db',
-            relief='flat'
-        )
-        dept_frame.pack(fill='x', padx=20, pady=10)
-        
-        for dept, count in report['department_distribution'].items():
-            self._create_progress_bar(dept_frame, dept, count, report['total_appointments'])
+        self._show_distribution("🏥 Department-wise Appointments", '#3498db',
+                                report['department_distribution'].items(), report['total_appointments'])
     
     def _display_financial_report(self):
         """Display financial report"""
-        # Clear existing content
-        for widget in self.report_frame.winfo_children():
-            widget.destroy()
+        self._clear_report()
         
         report = self.current_report
         
@@ -513,44 +653,29 @@ class ReportsWindow:
         
         # Payment method distribution
         if report['payment_method_distribution']:
-            payment_frame = tk.LabelFrame(
-                self.report_frame,
-                text="💳 Payment Methods",
-                font=('Segoe UI', 12, 'bold'),
-                bg='#1a1a2e',
-                fg='#2ecc71',
-                relief='flat'
+            self._show_distribution(
+                "💳 Payment Methods", '#2ecc71',
+                [(f"{method} (PKR {amount:.2f})", amount)
+                 for method, amount in report['payment_method_distribution'].items()],
+                report['total_paid']
             )
-            payment_frame.pack(fill='x', padx=20, pady=10)
-            
-            total_paid = report['total_paid']
-            for method, amount in report['payment_method_distribution'].items():
-                self._create_progress_bar(payment_frame, f"{method} (PKR {amount:.2f})", amount, total_paid)
         
         # Top services by revenue
         if report['service_revenue']:
-            service_frame = tk.LabelFrame(
-                self.report_frame,
-                text="🏥 Top Services by Revenue",
-                font=('Segoe UI', 12, 'bold'),
-                bg='#1a1a2e',
-                fg='#3498db',
-                relief='flat'
-            )
-            service_frame.pack(fill='x', padx=20, pady=10)
-            
-            # Sort services by revenue
-            sorted_services = sorted(report['service_revenue'].items(), key=lambda x: x[1], reverse=True)[:10]
-            total_service_revenue = sum(report['service_revenue'].values())
+            # Ten highest-earning services, without sorting the rest
+            service_revenue = report['service_revenue']
+            top_services = heapq.nlargest(10, service_revenue.items(), key=itemgetter(1))
+            total_service_revenue = sum(service_revenue.values())
             
-            for service, amount in sorted_services:
-                self._create_progress_bar(service_frame, f"{service} (PKR {amount:.2f})", amount, total_service_revenue)
+            self._show_distribution(
+                "🏥 Top Services by Revenue", '#3498db',
+                [(f"{service} (PKR {amount:.2f})", amount) for service, amount in top_services],
+                total_service_revenue
+            )
     
     def _display_department_report(self):
         """Display department report"""
-        # Clear existing content
-        for widget in self.report_frame.winfo_children():
-            widget.destroy()
+        self._clear_report()
         
         report = self.current_report
         
@@ -637,42 +762,166 @@ class ReportsWindow:
             fg='white'
         ).pack(pady=(0, 15))
     
-    def _create_progress_bar(self, parent, label, value, total):
-        """Create a progress bar with label"""
-        if total == 0:
-            percentage = 0
+    def _clear_report(self):
+        """Remove the current report's widgets, keeping pooled sections for reuse"""
+        pooled = set(self._section_pool)
+        for widget in self.report_frame.winfo_children():
+            if widget in pooled:
+                widget.pack_forget()
+            else:
+                widget.destroy()
+        self._sections_shown = 0
+    
+    def _show_distribution(self, title, color, items, total):
+        """
+        Show a distribution section, reusing a pooled one when available
+        
+        Sections are taken from the pool in display order, so each report
+        re-packs them below whatever it has shown so far.
+        
+        Args:
+            title: Section title
+            color: Title colour
+            items: (label, value) pairs, one progress bar each
+            total: Value corresponding to a full bar
+        """
+        index = self._sections_shown
+        if index < len(self._section_pool):
+            section = self._section_pool[index]
+            section.config(text=title, fg=color)
+            self._set_progress_rows(section.progress_canvas, items, total)
         else:
-            percentage = (value / total) * 100
+            section = tk.LabelFrame(
+                self.report_frame,
+                text=title,
+                font=('Segoe UI', 12, 'bold'),
+                bg='#1a1a2e',
+                fg=color,
+                relief='flat'
+            )
+            section.progress_canvas = self._create_progress_canvas(section, items, total)
+            self._section_pool.append(section)
         
-        row = tk.Frame(parent, bg='#1a1a2e')
-        row.pack(fill='x', padx=15, pady=8)
+        section.pack(fill='x', padx=20, pady=10)
+        self._sections_shown += 1
+    
+    def _create_progress_canvas(self, parent, items, total):
+        """
+        Draw labelled progress bars for a distribution on one canvas
         
-        # Label and value
-        label_frame = tk.Frame(row, bg='#1a1a2e')
-        label_frame.pack(fill='x')
+        Each row is a few canvas items rather than a frame of labels, so long
+        distributions do not create hundreds of widgets.
         
-        tk.Label(
-            label_frame,
-            text=label,
-            font=('Segoe UI', 10),
-            bg='#1a1a2e',
-            fg='#ffffff'
-        ).pack(side='left')
+        Args:
+            parent: Frame to pack the canvas into
+            items: (label, value) pairs, one row each
+            total: Value corresponding to a full bar
+            
+        Returns:
+            The progress canvas
+        """
+        canvas = tk.Canvas(parent, bg='#1a1a2e', highlightthickness=0)
+        canvas.pack(fill='x', pady=(0, 8))
         
-        tk.Label(
-            label_frame,
-            text=f"{value} ({percentage:.1f}%)",
-            font=('Segoe UI', 10),
-            bg='#1a1a2e',
-            fg='#7f8c8d'
-        ).pack(side='right')
+        # Bars scale with the width, so redraw the rows when it changes
+        canvas.bind('<Configure>', lambda event: self._draw_progress_rows(canvas, event.width))
         
-        # Progress bar
-        progress_bg = tk.Frame(row, bg='#16213e', height=8)
-        progress_bg.pack(fill='x', pady=(5, 0))
+        self._set_progress_rows(canvas, items, total)
+        return canvas
+    
+    def _set_progress_rows(self, canvas, items, total):
+        """
+        Replace the rows of a progress canvas and redraw it
+        
+        Args:
+            canvas: Canvas made by _create_progress_canvas
+            items: (label, value) pairs, one row each
+            total: Value corresponding to a full bar
+        """
+        rows = []
+        for label, value in items:
+            percentage = (value / total) * 100 if total else 0
+            rows.append((label, f"{value} ({percentage:.1f}%)", percentage / 100))
+        
+        canvas.progress_rows = rows
+        canvas.config(height=len(rows) * self.PROGRESS_ROW_HEIGHT)
+        
+        # A canvas that has not been laid out yet is drawn by its first <Configure>
+        width = canvas.winfo_width()
+        if width > 1:
+            self._draw_progress_rows(canvas, width)
+    
+    def _draw_progress_rows(self, canvas, width):
+        """Draw the rows of a progress canvas for the given width"""
+        canvas.delete('row')
+        row_height = self.PROGRESS_ROW_HEIGHT
+        left, right = 15, width - 15
+        for index, (label, value_text, fraction) in enumerate(canvas.progress_rows):
+            top = index * row_height + 8
+            canvas.create_text(left, top, text=label, anchor='nw',
+                               font=('Segoe UI', 10), fill='#ffffff', tags='row')
+            canvas.create_text(right, top, text=value_text, anchor='ne',
+                               font=('Segoe UI', 10), fill='#7f8c8d', tags='row')
+            bar_top = top + 25
+            canvas.create_rectangle(left, bar_top, right, bar_top + 8,
+                                    fill='#16213e', width=0, tags='row')
+            if fraction > 0:
+                canvas.create_rectangle(left, bar_top, left + (right - left) * fraction,
+                                        bar_top + 8, fill='#3498db', width=0, tags='row')
+    
+    def _format_report_lines(self, report):
+        """
+        Format a report as text, shared by the export and the text view
         
-        progress_fill = tk.Frame(progress_bg, bg='#3498db', height=8)
-        progress_fill.place(relwidth=percentage/100, relheight=1)
+        Args:
+            report: Report data
+            
+        Yields:
+            (line, tag) pairs; each line ends with a newline and the tag
+            names its style in the text view
+        """
+        yield _REPORT_RULE, 'muted'
+        yield f"{report['report_type'].upper()}\n", 'header'
+        yield _REPORT_RULE + '\n', 'muted'
+        yield f"Generated: {report['generated_at']}\n", 'muted'
+        if 'period' in report:
+            yield f"Period: {report['period']}\n", 'muted'
+        yield _REPORT_DIVIDER, 'muted'
+        
+        # Report data based on type
+        for key, value in report.items():
+            if key not in self.EXPORT_SKIPPED_KEYS:
+                yield f"{key.replace('_', ' ').title()}: {value}\n", 'body'
+        
+        yield '\n' + _REPORT_RULE, 'muted'
+    
+    def toggle_text_view(self):
+        """Switch the report display between the charts and the text view"""
+        self._showing_text = not self._showing_text
+        if not self._showing_text:
+            self.text_view.pack_forget()
+            self.chart_view.pack(fill='both', expand=True, padx=20, pady=(0, 20))
+            self.view_toggle_btn.config(text="📄 Text View")
+        else:
+            self.chart_view.pack_forget()
+            self.text_view.pack(fill='both', expand=True, padx=20, pady=(0, 20))
+            self.view_toggle_btn.config(text="📊 Chart View")
+            self._render_text_view()
+    
+    def _render_text_view(self):
+        """Fill the text view with the current report"""
+        text = self.report_text
+        text.config(state='normal')
+        text.delete('1.0', 'end')
+        if self.current_report:
+            # Insert every line with its tag in a single call
+            chunks = []
+            for line, tag in self._format_report_lines(self.current_report):
+                chunks.extend((line, tag))
+            text.insert('end', *chunks)
+        else:
+            text.insert('end', "No report to show yet", 'muted')
+        text.config(state='disabled')
     
     def export_report(self):
         """Export current report to text file"""
@@ -684,35 +933,14 @@ class ReportsWindow:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"report_{timestamp}.txt"
             
+            # One write for the whole report
             with open(filename, 'w') as f:
-                f.write(f"{'='*80}\n")
-                f.write(f"{self.current_report['report_type'].upper()}\n")
-                f.write(f"{'='*80}\n\n")
-                f.write(f"Generated: {self.current_report['generated_at']}\n")
-                
-                if 'period' in self.current_report:
-                    f.write(f"Period: {self.current_report['period']}\n")
-                
-                f.write(f"\n{'-'*80}\n\n")
-                
-                # Write report data based on type
-                for key, value in self.current_report.items():
-                    if key not in ['report_type', 'generated_at', 'period', 'patients', 'appointments', 'bills', 'error']:
-                        f.write(f"{key.replace('_', ' ').title()}: {value}\n")
-                
-                f.write(f"\n{'='*80}\n")
+                f.write(''.join(line for line, _ in self._format_report_lines(self.current_report)))
             
             messagebox.showinfo("Success", f"Report exported to {filename}", parent=self.window)
         except Exception as e:
             messagebox.showerror("Error", f"Failed to export report: {str(e)}", parent=self.window)
     
-    def _darken_color(self, hex_color):
-        """Darken a hex color by 20%"""
-        hex_color = hex_color.lstrip('#')
-        rgb = tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
-        darkened = tuple(int(c * 0.8) for c in rgb)
-        return f"#{darkened[0]:02x}{darkened[1]:02x}{darkened[2]:02x}"
-    
     def run(self):
         """Start the reports window"""
         self.window.mainloop()
@@ -7,12 +7,14 @@ import tkinter as tk
 from tkinter import messagebox, ttk
 from app.models.user import User
 from app.utils.validators import validate_email, validate_phone, ValidationException
+from app.utils.styles import add_hover, emoji_font, init_styles
+from app.utils.window import bind_mousewheel, bind_scrollregion, center_window
 
 
 class SettingsWindow:
     """Settings and preferences window"""
     
-    def __init__(self, user: User, db_connector, auth_service):
+    def __init__(self, user: User, db_connector, auth_service, master=None):
         """
         Initialize settings window
         
@@ -20,31 +22,20 @@ class SettingsWindow:
             user: Current logged-in user
             db_connector: Database connector instance
             auth_service: Authentication service instance
+            master: Parent window
         """
         self.user = user
         self.db = db_connector
         self.auth_service = auth_service
         
-        self.window = tk.Toplevel()
+        self.window = tk.Toplevel(master)
         self.window.title("Settings & Preferences")
-        self.window.geometry("1000x700")
+        center_window(self.window, 1000, 700)
         self.window.configure(bg='#1a1a2e')
         
-        # Center window
-        self._center_window()
-        
         # Create UI
         self._create_widgets()
     
-    def _center_window(self):
-        """Center window on screen"""
-        self.window.update_idletasks()
-        width = self.window.winfo_width()
-        height = self.window.winfo_height()
-        x = (self.window.winfo_screenwidth() // 2) - (width // 2)
-        y = (self.window.winfo_screenheight() // 2) - (height // 2)
-        self.window.geometry(f'{width}x{height}+{x}+{y}')
-    
     def _create_widgets(self):
         """Create UI widgets"""
         # Header
@@ -59,7 +50,7 @@ class SettingsWindow:
         icon_label = tk.Label(
             header_content,
             text="⚙️",
-            font=('Segoe UI Emoji', 24),
+            font=emoji_font(self.window, 24),
             bg='#16213e',
             fg='#3498db'
         )
@@ -106,22 +97,10 @@ class SettingsWindow:
         right_panel.pack(side='right', fill='both', expand=True)
         
         # Create notebook for different settings sections
-        self.notebook = ttk.Notebook(right_panel)
+        init_styles(self.window)
+        self.notebook = ttk.Notebook(right_panel, style='Settings.TNotebook')
         self.notebook.pack(fill='both', expand=True, padx=20, pady=20)
         
-        # Style notebook
-        style = ttk.Style()
-        style.theme_use('clam')
-        style.configure('TNotebook', background='#16213e', borderwidth=0)
-        style.configure('TNotebook.Tab', 
-                       background='#1a1a2e',
-                       foreground='#ffffff',
-                       padding=[20, 10],
-                       font=('Segoe UI', 10))
-        style.map('TNotebook.Tab',
-                 background=[('selected', '#3498db')],
-                 foreground=[('selected', '#ffffff')])
-        
         # Create tabs
         self._create_profile_tab()
         self._create_security_tab()
@@ -161,8 +140,7 @@ class SettingsWindow:
                 command=lambda idx=tab_index: self.notebook.select(idx)
             )
             btn.pack(fill='x', padx=10, pady=5, ipady=8)
-            btn.bind('<Enter>', lambda e, b=btn: b.config(bg='#3498db'))
-            btn.bind('<Leave>', lambda e, b=btn: b.config(bg='#1a1a2e'))
+            add_hover(btn, '#3498db', '#1a1a2e')
     
     def _create_profile_tab(self):
         """Create profile settings tab"""
@@ -184,7 +162,7 @@ class SettingsWindow:
             canvas.configure(scrollregion=canvas.bbox('all'))
             canvas.itemconfig(canvas_window, width=event.width)
         
-        content.bind('<Configure>', lambda e: canvas.configure(scrollregion=canvas.bbox('all')))
+        bind_scrollregion(canvas, content)
         canvas.bind('<Configure>', configure_scroll)
         
         # Profile information
@@ -203,7 +181,7 @@ class SettingsWindow:
             ("Full Name:", self.user.full_name, True),
             ("Email:", self.user.email, True),
             ("Phone:", self.user.phone, True),
-            ("Role:", self.user.role.value.title(), False),
+            ("Role:", self.user.role.display_name, False),
         ]
         
         if self.user.role.value == 'doctor':
@@ -263,8 +241,7 @@ class SettingsWindow:
             command=self.save_profile
         )
         save_btn.pack(pady=20)
-        save_btn.bind('<Enter>', lambda e: save_btn.config(bg='#2980b9'))
-        save_btn.bind('<Leave>', lambda e: save_btn.config(bg='#3498db'))
+        add_hover(save_btn, '#2980b9', '#3498db')
     
     def _create_security_tab(self):
         """Create security settings tab"""
@@ -307,8 +284,7 @@ class SettingsWindow:
             command=self.change_password
         )
         change_btn.pack(pady=20)
-        change_btn.bind('<Enter>', lambda e: change_btn.config(bg='#d35400'))
-        change_btn.bind('<Leave>', lambda e: change_btn.config(bg='#e67e22'))
+        add_hover(change_btn, '#d35400', '#e67e22')
         
         # Security tips
         tips_frame = tk.LabelFrame(
@@ -416,13 +392,11 @@ class SettingsWindow:
             canvas.configure(scrollregion=canvas.bbox('all'))
             canvas.itemconfig(canvas_window, width=event.width)
         
-        content.bind('<Configure>', lambda e: canvas.configure(scrollregion=canvas.bbox('all')))
+        bind_scrollregion(canvas, content)
         canvas.bind('<Configure>', configure_scroll)
         
-        # Enable mousewheel scrolling
-        def _on_mousewheel(event):
-            canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-        canvas.bind_all("<MouseWheel>", _on_mousewheel)
+        # Scroll with the mouse wheel while the pointer is over the canvas
+        bind_mousewheel(canvas)
         
         # Add padding container
         padded_content = tk.Frame(content, bg='#16213e')
@@ -453,8 +427,7 @@ class SettingsWindow:
             command=lambda: self._refresh_db_stats(self.db_stats_labels)
         )
         refresh_btn.pack(side='right', padx=5)
-        refresh_btn.bind('<Enter>', lambda e: refresh_btn.config(bg='#2980b9'))
-        refresh_btn.bind('<Leave>', lambda e: refresh_btn.config(bg='#3498db'))
+        add_hover(refresh_btn, '#2980b9', '#3498db')
         
         self.db_info_frame = tk.Frame(padded_content, bg='#1a1a2e')
         self.db_info_frame.pack(fill='x', pady=10)
@@ -512,7 +485,7 @@ class SettingsWindow:
         tk.Label(
             content,
             text="🏥",
-            font=('Segoe UI Emoji', 48),
+            font=emoji_font(self.window, 48),
             bg='#16213e',
             fg='#3498db'
         ).pack(pady=(20, 10))
@@ -5,6 +5,7 @@ Tests for authentication service
 import unittest
 import os
 import shutil
+from unittest.mock import Mock
 from app.services.auth_service import AuthService, AuthenticationException
 from app.models.user import User, UserRole
 from app.utils.db_connector import DatabaseConnector
@@ -88,5 +89,20 @@ class TestAuthService(unittest.TestCase):
         self.assertTrue(self.auth_service.has_permission(UserRole.NURSE))
 
 
+class TestAuthServicePasswordBounds(unittest.TestCase):
+    """Test cases for password length pre-validation"""
+    
+    def test_rejects_out_of_range_password_without_lookup(self):
+        """Test that impossible password lengths fail before touching the database"""
+        db = Mock()
+        auth_service = AuthService(db)
+        
+        for password in ('abc', 'x' * (AuthService.MAX_PASSWORD_LENGTH + 1)):
+            with self.assertRaises(AuthenticationException):
+                auth_service.login('admin', password)
+        
+        db.read.assert_not_called()
+
+
 if __name__ == '__main__':
     unittest.main()
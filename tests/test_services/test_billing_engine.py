@@ -0,0 +1,68 @@
+"""
+Tests for billing engine service
+"""
+
+import unittest
+import os
+import shutil
+from app.services.billing_engine import BillingEngine, BillingItem
+from app.utils.db_connector import DatabaseConnector
+
+
+class TestBillingEngine(unittest.TestCase):
+    """Test cases for billing engine"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.test_data_dir = "test_data_billing"
+        if os.path.exists(self.test_data_dir):
+            shutil.rmtree(self.test_data_dir)
+
+        self.db = DatabaseConnector(data_dir=self.test_data_dir)
+        BillingEngine._instance = None
+
+    def tearDown(self):
+        """Clean up test fixtures"""
+        BillingEngine._instance = None
+        self.db.close()
+        if os.path.exists(self.test_data_dir):
+            shutil.rmtree(self.test_data_dir)
+
+    def test_instance_is_reused(self):
+        """Test that the shared engine is reused for the same connector"""
+        engine = BillingEngine.instance(self.db)
+        self.assertIs(BillingEngine.instance(self.db), engine)
+        self.assertIs(engine.db, self.db)
+
+    def test_instance_rebinds_new_connector(self):
+        """Test that a different connector gets a fresh engine"""
+        engine = BillingEngine.instance(self.db)
+        other_dir = "test_data_billing_other"
+        other_db = DatabaseConnector(data_dir=other_dir)
+        try:
+            other_engine = BillingEngine.instance(other_db)
+            self.assertIsNot(other_engine, engine)
+            self.assertIs(other_engine.db, other_db)
+        finally:
+            other_db.close()
+            shutil.rmtree(other_dir, ignore_errors=True)
+
+
+class TestBillingItem(unittest.TestCase):
+    """Test cases for billing items"""
+
+    def test_to_dict_follows_field_changes(self):
+        """Test that changing a field is reflected in the cached dictionary"""
+        item = BillingItem('X-Ray', 1, 800.0)
+        self.assertEqual(item.to_dict()['total'], 800.0)
+
+        item.quantity = 3
+        self.assertEqual(item.to_dict()['quantity'], 3)
+        self.assertEqual(item.to_dict()['total'], 2400.0)
+
+        item.unit_price = 500.0
+        self.assertEqual(item.to_dict()['total'], 1500.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
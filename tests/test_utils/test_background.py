@@ -0,0 +1,72 @@
+"""
+Tests for background task helper
+"""
+
+import time
+import unittest
+from app.utils.background import run_in_background
+
+
+class FakeWidget:
+    """Minimal stand-in for a Tk widget that runs after() callbacks on demand"""
+    
+    def __init__(self):
+        self.pending = []
+        self.exists = True
+    
+    def after(self, delay, callback):
+        self.pending.append(callback)
+    
+    def winfo_exists(self):
+        return self.exists
+    
+    def pump(self, timeout=2.0):
+        """Run scheduled callbacks until none are left"""
+        deadline = time.time() + timeout
+        while self.pending and time.time() < deadline:
+            callback = self.pending.pop(0)
+            callback()
+            time.sleep(0.001)
+
+
+class TestRunInBackground(unittest.TestCase):
+    """Test cases for run_in_background"""
+    
+    def test_success_delivered_on_poll(self):
+        """Test that the task result is passed to on_success"""
+        widget = FakeWidget()
+        results = []
+        
+        run_in_background(widget, lambda: 42, results.append)
+        widget.pump()
+        
+        self.assertEqual(results, [42])
+    
+    def test_error_delivered_on_poll(self):
+        """Test that a raised exception is passed to on_error"""
+        widget = FakeWidget()
+        errors = []
+        
+        def task():
+            raise ValueError("boom")
+        
+        run_in_background(widget, task, lambda value: None, errors.append)
+        widget.pump()
+        
+        self.assertEqual(len(errors), 1)
+        self.assertIsInstance(errors[0], ValueError)
+    
+    def test_nothing_delivered_after_widget_destroyed(self):
+        """Test that callbacks are skipped once the widget is gone"""
+        widget = FakeWidget()
+        results = []
+        
+        run_in_background(widget, lambda: 42, results.append)
+        widget.exists = False
+        widget.pump()
+        
+        self.assertEqual(results, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,199 @@
+"""
+Tests for database connector
+"""
+
+import unittest
+import os
+import shutil
+from sqlalchemy import event
+from app.utils.db_connector import DatabaseConnector, DatabaseException
+
+
+class TestDatabaseConnector(unittest.TestCase):
+    """Test cases for database connector"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.test_data_dir = "test_data_db"
+        if os.path.exists(self.test_data_dir):
+            shutil.rmtree(self.test_data_dir)
+        
+        self.db = DatabaseConnector(data_dir=self.test_data_dir)
+        
+        for bill_id, bill_date in [('INV001', '2025-01-01'), ('INV002', '2025-01-03'),
+                                   ('INV003', '2025-01-02'), ('INV004', '2025-01-03')]:
+            self.db.create('billing', {
+                'bill_id': bill_id,
+                'patient_id': 'PAT001',
+                'patient_name': 'John Doe',
+                'bill_date': bill_date,
+                'services': '[]',
+                'total_amount': '100.0'
+            })
+    
+    def tearDown(self):
+        """Clean up test fixtures"""
+        self.db.close()
+        if os.path.exists(self.test_data_dir):
+            shutil.rmtree(self.test_data_dir)
+    
+    def test_read_order_by(self):
+        """Test reading records in a given order"""
+        bills = self.db.read('billing', order_by='bill_date DESC, bill_id DESC')
+        
+        self.assertEqual([b['bill_id'] for b in bills], ['INV004', 'INV002', 'INV003', 'INV001'])
+    
+    def test_read_limit_offset(self):
+        """Test reading records one page at a time"""
+        first_page = self.db.read('billing', order_by='bill_id', limit=3)
+        second_page = self.db.read('billing', order_by='bill_id', limit=3, offset=3)
+        
+        self.assertEqual([b['bill_id'] for b in first_page], ['INV001', 'INV002', 'INV003'])
+        self.assertEqual([b['bill_id'] for b in second_page], ['INV004'])
+    
+    def test_get_by_id(self):
+        """Test fetching a single record by its ID"""
+        bill = self.db.get_by_id('billing', 'INV003')
+        
+        self.assertIsNotNone(bill)
+        self.assertEqual(bill['bill_date'], '2025-01-02')
+    
+    def test_get_by_id_not_found(self):
+        """Test fetching a record that does not exist"""
+        self.assertIsNone(self.db.get_by_id('billing', 'INV999'))
+    
+    def test_read_order_by_unknown_column(self):
+        """Test ordering by a column that does not exist"""
+        with self.assertRaises(DatabaseException):
+            self.db.read('billing', order_by='nonexistent')
+    
+    def test_read_search(self):
+        """Test case-insensitive substring search across several columns"""
+        self.db.create('billing', {
+            'bill_id': 'INV005',
+            'patient_id': 'PAT002',
+            'patient_name': 'Jane 100% Smith',
+            'bill_date': '2025-01-04',
+            'services': '[]',
+            'total_amount': '50.0'
+        })
+        
+        by_name = self.db.read('billing', search='jane', search_fields=['bill_id', 'patient_name'])
+        by_id = self.db.read('billing', search='inv00', search_fields=['bill_id', 'patient_name'],
+                             order_by='bill_id', limit=2)
+        literal = self.db.read('billing', search='0%', search_fields=['patient_name'])
+        
+        self.assertEqual([b['bill_id'] for b in by_name], ['INV005'])
+        self.assertEqual([b['bill_id'] for b in by_id], ['INV001', 'INV002'])
+        self.assertEqual([b['bill_id'] for b in literal], ['INV005'])
+    
+    def test_read_search_words(self):
+        """Test that every search word must match, each in any column"""
+        both_words = self.db.read('billing', search='doe inv003', search_fields=['bill_id', 'patient_name'])
+        missing_word = self.db.read('billing', search='doe smith', search_fields=['bill_id', 'patient_name'])
+        
+        self.assertEqual([b['bill_id'] for b in both_words], ['INV003'])
+        self.assertEqual(missing_word, [])
+    
+    def test_read_search_unknown_column(self):
+        """Test searching a column that does not exist"""
+        with self.assertRaises(DatabaseException):
+            self.db.read('billing', search='x', search_fields=['nonexistent'])
+    
+    def test_count(self):
+        """Test counting records with and without filters"""
+        self.assertEqual(self.db.count('billing'), 4)
+        self.assertEqual(self.db.count('billing', {'bill_date': '2025-01-03'}), 2)
+        self.assertEqual(self.db.count('billing', {'bill_date': '2024-12-31'}), 0)
+    
+    def test_count_active_uses_index(self):
+        """Test that counting active patients is answered from the is_active index"""
+        statements = []
+        
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            statements.append((statement, parameters))
+        
+        event.listen(self.db.engine, 'before_cursor_execute', capture)
+        try:
+            self.db.count('patients', {'is_active': True})
+        finally:
+            event.remove(self.db.engine, 'before_cursor_execute', capture)
+        
+        statement, parameters = statements[-1]
+        with self.db.engine.connect() as conn:
+            plan = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).fetchall()
+        
+        self.assertIn('ix_patients_active', ' '.join(row[-1] for row in plan))
+    
+    def test_read_rows(self):
+        """Test reading selected columns and SQL expressions as tuples"""
+        rows = self.db.read_rows(
+            'billing',
+            ['bill_id', "printf('PKR %.2f', total_amount)", "UPPER(COALESCE(payment_status, 'pending'))"],
+            filters={'bill_date': '2025-01-03'},
+            order_by='bill_id'
+        )
+        
+        self.assertEqual(rows, [('INV002', 'PKR 100.00', 'PENDING'), ('INV004', 'PKR 100.00', 'PENDING')])
+    
+    def test_stream_rows(self):
+        """Test iterating over records in batches"""
+        rows = self.db.stream_rows('billing', ['bill_id'], order_by='bill_id', batch_size=3)
+        
+        self.assertEqual(list(rows), [('INV001',), ('INV002',), ('INV003',), ('INV004',)])
+    
+    def test_update(self):
+        """Test updating a record in place"""
+        self.assertTrue(self.db.update('billing', 'INV002', 'bill_id', {'payment_status': 'paid'}))
+        self.assertFalse(self.db.update('billing', 'INV999', 'bill_id', {'payment_status': 'paid'}))
+        
+        self.assertEqual(self.db.get_by_id('billing', 'INV002')['payment_status'], 'paid')
+        self.assertEqual(self.db.get_by_id('billing', 'INV001')['payment_status'], 'pending')
+    
+    def test_update_field(self):
+        """Test setting a single field with one UPDATE"""
+        self.assertTrue(self.db.update_field('billing', 'INV003', 'bill_id', 'payment_status', 'paid'))
+        self.assertFalse(self.db.update_field('billing', 'INV999', 'bill_id', 'payment_status', 'paid'))
+        
+        self.assertEqual(self.db.get_by_id('billing', 'INV003')['payment_status'], 'paid')
+        self.assertEqual(self.db.get_by_id('billing', 'INV004')['payment_status'], 'pending')
+    
+    def test_update_field_unknown_column(self):
+        """Test setting a field that does not exist"""
+        with self.assertRaises(DatabaseException):
+            self.db.update_field('billing', 'INV001', 'bill_id', 'nonexistent', 'x')
+    
+    def test_get_next_id(self):
+        """Test generating the next ID from the highest numeric suffix"""
+        self.assertEqual(self.db.get_next_id('billing', 'INV'), 'INV005')
+        self.assertEqual(self.db.get_next_id('patients', 'PAT'), 'PAT001')
+        
+        self.db.create('billing', {
+            'bill_id': 'INV1000',
+            'patient_id': 'PAT001',
+            'patient_name': 'John Doe',
+            'bill_date': '2025-01-04',
+            'services': '[]',
+            'total_amount': '100.0'
+        })
+        self.assertEqual(self.db.get_next_id('billing', 'INV'), 'INV1001')
+    
+    def test_get_next_id_skips_non_numeric_suffixes(self):
+        """Test that IDs with a non-numeric suffix or other-case prefix are ignored"""
+        for bill_id in ['INV2025-001', 'inv900', 'INVX50']:
+            self.db.create('billing', {
+                'bill_id': bill_id,
+                'patient_id': 'PAT001',
+                'patient_name': 'John Doe',
+                'bill_date': '2025-01-04',
+                'services': '[]',
+                'total_amount': '100.0'
+            })
+        self.assertEqual(self.db.get_next_id('billing', 'INV'), 'INV005')
+        
+        # '_' in a prefix is matched literally, not as a wildcard
+        self.assertEqual(self.db.get_next_id('billing', 'IN_'), 'IN_001')
+
+
+if __name__ == '__main__':
+    unittest.main()
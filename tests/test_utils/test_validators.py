@@ -0,0 +1,47 @@
+"""
+Tests for input validators
+"""
+
+import unittest
+from app.utils.validators import validate_date, validate_email, validate_phone, ValidationException
+
+
+class TestValidators(unittest.TestCase):
+    """Test cases for input validators"""
+
+    def test_validate_date_iso(self):
+        """Test that a valid ISO date passes"""
+        self.assertTrue(validate_date("2000-01-31"))
+
+    def test_validate_date_rejects_malformed(self):
+        """Test that dates not in YYYY-MM-DD form are rejected"""
+        for value in ("2000-1-31", "20000131", "31-01-2000", "2000-01-31 "):
+            with self.assertRaises(ValidationException):
+                validate_date(value)
+
+    def test_validate_date_rejects_impossible(self):
+        """Test that a well-formed but impossible date is rejected"""
+        with self.assertRaises(ValidationException):
+            validate_date("2001-02-29")
+
+    def test_validate_date_custom_format(self):
+        """Test that a non-default format is still honoured"""
+        self.assertTrue(validate_date("31/01/2000", "%d/%m/%Y"))
+        with self.assertRaises(ValidationException):
+            validate_date("2000-01-31", "%d/%m/%Y")
+
+    def test_validate_email(self):
+        """Test email validation"""
+        self.assertTrue(validate_email("john.doe@example.com"))
+        with self.assertRaises(ValidationException):
+            validate_email("john.doe@example")
+
+    def test_validate_phone_separators(self):
+        """Test that phone separators are ignored"""
+        self.assertTrue(validate_phone("(0300) 123-4567"))
+        with self.assertRaises(ValidationException):
+            validate_phone("0300-12a-4567")
+
+
+if __name__ == '__main__':
+    unittest.main()